@@ -1,7 +1,14 @@
 """Command handler for parsing and executing user commands."""
 
 import shlex
-from typing import Dict, List, Callable, Optional, Any
+import sys
+from typing import Dict, List, Callable, Optional, Any, Tuple
+
+# Response for the built-in quit/exit commands; handlers return copies
+_QUIT_RESPONSE = {"success": True, "message": "Goodbye!", "exit": True}
+
+# Response for empty input; process_input returns copies
+_EMPTY_RESPONSE = {"success": True, "message": "", "exit": False}
 
 
 class Command:
@@ -21,6 +28,8 @@ class CommandHandler:
 
     def __init__(self):
         self._commands: Dict[str, Callable] = {}
+        # Sorted command names, rebuilt lazily after each registration
+        self._sorted_names: Optional[Tuple[str, ...]] = None
         # Flag used to confirm destructive operations like resetting the
         # session when the user types 'new' once and must confirm by
         # typing 'new' again. Cleared automatically when any other
@@ -42,7 +51,8 @@ class CommandHandler:
             name: Command name
             handler: Function to handle the command
         """
-        self._commands[name.lower()] = handler
+        self._commands[sys.intern(name.lower())] = handler
+        self._sorted_names = None
 
     def parse_command(self, user_input: str) -> Optional[Command]:
         """Parse user input into a Command object.
@@ -53,15 +63,20 @@ class CommandHandler:
         Returns:
             Command object or None if input is empty/invalid
         """
-        if not user_input.strip():
+        stripped = user_input.strip()
+        if not stripped:
             return None
 
-        try:
-            # Use shlex to properly handle quoted arguments
-            tokens = shlex.split(user_input.strip())
-        except ValueError:
-            # Handle unclosed quotes gracefully
-            tokens = user_input.strip().split()
+        if '"' not in stripped and "'" not in stripped and "\\" not in stripped:
+            # No quotes or escapes: shlex would split on whitespace anyway
+            tokens = stripped.split()
+        else:
+            try:
+                # Use shlex to properly handle quoted arguments
+                tokens = shlex.split(stripped)
+            except ValueError:
+                # Handle unclosed quotes gracefully
+                tokens = stripped.split()
 
         if not tokens:
             return None
@@ -69,7 +84,7 @@ class CommandHandler:
         command_name = tokens[0].lower()
         args = tokens[1:] if len(tokens) > 1 else []
 
-        return Command(command_name, args, user_input.strip())
+        return Command(command_name, args, stripped)
 
     def execute_command(self, command: Command) -> Dict[str, Any]:
         """Execute a parsed command.
@@ -83,7 +98,8 @@ class CommandHandler:
             - message: str with result message
             - exit: bool indicating if application should exit
         """
-        if command.name not in self._commands:
+        handler = self._commands.get(command.name)
+        if handler is None:
             return {
                 "success": False,
                 "message": f"Unknown command: {command.name}. Type 'help' for available commands.",
@@ -91,7 +107,6 @@ class CommandHandler:
             }
 
         try:
-            handler = self._commands[command.name]
             return handler(command)
         except Exception as e:
             return {
@@ -112,7 +127,7 @@ class CommandHandler:
         command = self.parse_command(user_input)
 
         if command is None:
-            return {"success": True, "message": "", "exit": False}
+            return _EMPTY_RESPONSE.copy()
 
         # If the parsed command is not the 'new' confirmation token, clear
         # any pending 'new' confirmation so that typing anything other than
@@ -124,17 +139,22 @@ class CommandHandler:
 
     def get_available_commands(self) -> List[str]:
         """Get list of available command names."""
-        return sorted(self._commands.keys())
+        return list(self._command_names())
+
+    def _command_names(self) -> Tuple[str, ...]:
+        """Return the cached, sorted command names without copying them."""
+        if self._sorted_names is None:
+            self._sorted_names = tuple(sorted(self._commands))
+        return self._sorted_names
 
     def _help_command(self, command: Command) -> Dict[str, Any]:
         """Built-in help command handler."""
-        available_commands = self.get_available_commands()
         message = "Available commands:\n" + "\n".join(
-            f"  {cmd}" for cmd in available_commands
+            f"  {cmd}" for cmd in self._command_names()
         )
 
         return {"success": True, "message": message, "exit": False}
 
     def _quit_command(self, command: Command) -> Dict[str, Any]:
         """Built-in quit/exit command handler."""
-        return {"success": True, "message": "Goodbye!", "exit": True}
+        return _QUIT_RESPONSE.copy()
@@ -1,23 +1,40 @@
 """Example of extending the command handler with custom commands."""
 
+import random
+import re
 from pathlib import Path
 from lib.command_handler import CommandHandler
 from lib.journey_system import JourneyManager
-from lib.state_manager import StateManager
 from lib.journal_manager import JournalManager
 from lib.game_manager import GameManager
-from lib.player_context import PlayerCreationHandler
-from lib.template_loader import TemplateLoader
-from lib.template_player_context import TemplatePlayerCreationHandler
 
+# Dice notation for the roll command: optional count, 'd', sides
+_DICE_RE = re.compile(r"(\d*)d(\d+)")
+_DICE_FULLMATCH = _DICE_RE.fullmatch
 
-def create_extended_command_handler():
-    """Create a command handler with additional custom commands."""
+# Roll modifiers accepted after the dice notation
+_ADVANTAGE_WORDS = frozenset(("advantage", "adv", "a"))
+_DISADVANTAGE_WORDS = frozenset(("disadvantage", "disadv", "d"))
+
+# Fixed error and usage messages
+_ROLL_USAGE = "Usage: roll <dice> [advantage|disadvantage] (e.g., 'roll 2d6', 'roll d20 advantage')"
+_INVALID_DICE = "Invalid dice notation. Use format like '2d6' or 'd20'"
+_TOO_MANY_DICE = "Too many dice! Maximum is 100 dice per roll."
+_LOAD_USAGE = "Usage: load <save_name>"
+_NO_GAME_SELECTED = "No game selected. Use 'new' or 'select' to choose a game."
+
+
+def create_extended_command_handler(saves_directory: str = "saves"):
+    """Create a command handler with additional custom commands.
+
+    Args:
+        saves_directory: Root directory for games and saves (default: "saves")
+    """
     import yaml
     handler = CommandHandler()
 
     # Initialize managers
-    game_manager = GameManager()
+    game_manager = GameManager(saves_directory)
     journey_manager = JourneyManager()
 
     # Get current game and set up journal manager with game-specific path
@@ -48,7 +65,9 @@ def create_extended_command_handler():
     else:
         # No current game - use a placeholder journal that won't create root-level file
         # We'll set the proper path when a game is selected
-        journal_manager = JournalManager("saves/.journal_placeholder")
+        journal_manager = JournalManager(
+            str(Path(saves_directory) / ".journal_placeholder")
+        )
 
     # Register custom commands
     handler.register_command("roll", _roll_dice_command)
@@ -125,14 +144,24 @@ def create_extended_command_handler():
     return handler
 
 
+def _roll_dice(num_dice, sides):
+    """Roll num_dice dice with the given number of sides.
+
+    A single die uses random.randint; several dice are drawn in one
+    random.choices call, which is cheaper from two dice upwards. Both are
+    looked up on each call (not at import) so tests can patch them.
+    """
+    if num_dice == 1:
+        return [random.randint(1, sides)]
+    return random.choices(range(1, sides + 1), k=num_dice)
+
+
 def _roll_dice_command(command):
     """Roll dice command - example: roll 2d6 or roll d20 [advantage|disadvantage]."""
-    import random
-
     if not command.args:
         return {
             "success": False,
-            "message": "Usage: roll <dice> [advantage|disadvantage] (e.g., 'roll 2d6', 'roll d20 advantage')",
+            "message": _ROLL_USAGE,
             "exit": False,
         }
 
@@ -142,9 +171,9 @@ def _roll_dice_command(command):
     advantage_mode = None
     if len(command.args) > 1:
         modifier = command.args[1].lower()
-        if modifier in ["advantage", "adv", "a"]:
+        if modifier in _ADVANTAGE_WORDS:
             advantage_mode = "advantage"
-        elif modifier in ["disadvantage", "disadv", "d"]:
+        elif modifier in _DISADVANTAGE_WORDS:
             advantage_mode = "disadvantage"
         else:
             return {
@@ -161,19 +190,16 @@ def _roll_dice_command(command):
         if "d" not in dice_notation:
             return {
                 "success": False,
-                "message": "Invalid dice notation. Use format like '2d6' or 'd20'",
+                "message": _INVALID_DICE,
                 "exit": False,
             }
 
-        if dice_notation.startswith("d"):
-            # Handle 'd20' format (single die)
-            num_dice = 1
-            sides = int(dice_notation[1:])
-        else:
-            # Handle '2d6' format (multiple dice)
-            parts = dice_notation.split("d")
-            num_dice = int(parts[0])
-            sides = int(parts[1])
+        # Handle 'd20' (single die) and '2d6' (multiple dice) formats
+        match = _DICE_FULLMATCH(dice_notation)
+        if match is None:
+            raise ValueError("Expected a format like '2d6' or 'd20'")
+        num_dice = int(match.group(1)) if match.group(1) else 1
+        sides = int(match.group(2))
 
         if num_dice <= 0 or sides <= 0:
             raise ValueError("Dice count and sides must be positive")
@@ -181,14 +207,14 @@ def _roll_dice_command(command):
         if num_dice > 100:
             return {
                 "success": False,
-                "message": "Too many dice! Maximum is 100 dice per roll.",
+                "message": _TOO_MANY_DICE,
                 "exit": False,
             }
 
         if advantage_mode:
             # Roll two sets of dice for advantage/disadvantage
-            rolls1 = [random.randint(1, sides) for _ in range(num_dice)]
-            rolls2 = [random.randint(1, sides) for _ in range(num_dice)]
+            rolls1 = _roll_dice(num_dice, sides)
+            rolls2 = _roll_dice(num_dice, sides)
             total1 = sum(rolls1)
             total2 = sum(rolls2)
 
@@ -221,7 +247,7 @@ def _roll_dice_command(command):
                 )
         else:
             # Normal roll
-            rolls = [random.randint(1, sides) for _ in range(num_dice)]
+            rolls = _roll_dice(num_dice, sides)
             total = sum(rolls)
 
             if num_dice == 1:
@@ -257,11 +283,11 @@ def _status_command(command, journey_manager, game_manager):
     if current_game:
         game_path = game_manager.get_game_path(current_game)
         player_manager = PlayerManager(game_path)
-        player_count = player_manager.get_player_count()
+        # Count the players that actually loaded so the header matches the list
+        players = player_manager.get_all_players()
 
-        if player_count > 0:
-            status_lines.append(f"\nParty Members ({player_count}):")
-            players = player_manager.get_all_players()
+        if players:
+            status_lines.append(f"\nParty Members ({len(players)}):")
             for i, player in enumerate(players, 1):
                 # Build ability abbreviations (only show set abilities)
                 ability_abbrev = []
@@ -297,6 +323,8 @@ def _status_command(command, journey_manager, game_manager):
 
 def _save_command(command, journey_manager, game_manager):
     """Save game state to YAML file."""
+    from lib.state_manager import StateManager
+
     save_name = command.args[0] if command.args else "quicksave"
 
     # Get StateManager for current game
@@ -304,7 +332,7 @@ def _save_command(command, journey_manager, game_manager):
     if not current_game:
         return {
             "success": False,
-            "message": "No game selected. Use 'new' or 'select' to choose a game.",
+            "message": _NO_GAME_SELECTED,
             "exit": False,
         }
 
@@ -321,8 +349,10 @@ def _save_command(command, journey_manager, game_manager):
 
 def _load_command(command, journey_manager, game_manager):
     """Load game state from YAML file."""
+    from lib.state_manager import StateManager
+
     if not command.args:
-        return {"success": False, "message": "Usage: load <save_name>", "exit": False}
+        return {"success": False, "message": _LOAD_USAGE, "exit": False}
 
     save_name = command.args[0]
 
@@ -331,7 +361,7 @@ def _load_command(command, journey_manager, game_manager):
     if not current_game:
         return {
             "success": False,
-            "message": "No game selected. Use 'new' or 'select' to choose a game.",
+            "message": _NO_GAME_SELECTED,
             "exit": False,
         }
 
@@ -360,12 +390,14 @@ def _load_command(command, journey_manager, game_manager):
 
 def _saves_command(command, game_manager):
     """List available save files."""
+    from lib.state_manager import StateManager
+
     # Get StateManager for current game
     current_game = game_manager.get_current_game()
     if not current_game:
         return {
             "success": False,
-            "message": "No game selected. Use 'new' or 'select' to choose a game.",
+            "message": _NO_GAME_SELECTED,
             "exit": False,
         }
 
@@ -851,8 +883,6 @@ def _fate_command(command):
     Example: fate safe,encounter
     Rolls a d100 and selects one of the options with equal probability.
     """
-    import random
-
     if not command.args:
         return {
             "success": False,
@@ -997,6 +1027,10 @@ def _confirmation_command(command, response, game_manager, journey_manager,
 
 def _create_player_command(command, game_manager, handler):
     """Create a new player character in the current game."""
+    from lib.player_context import PlayerCreationHandler
+    from lib.template_loader import TemplateLoader, user_cache_dir
+    from lib.template_player_context import TemplatePlayerCreationHandler
+
     current_game = game_manager.get_current_game()
 
     if not current_game:
@@ -1012,7 +1046,7 @@ def _create_player_command(command, game_manager, handler):
     if template_name:
         # Load template-based player creation
         templates_dir = Path(__file__).parent.parent / "templates" / "player"
-        template_loader = TemplateLoader(str(templates_dir))
+        template_loader = TemplateLoader(str(templates_dir), str(user_cache_dir()))
 
         template = template_loader.load_template(template_name)
         if not template:
@@ -1061,8 +1095,9 @@ def _create_player_command(command, game_manager, handler):
 def _list_templates_command(command):
     """List available player creation templates."""
     from pathlib import Path
+    from lib.template_loader import TemplateLoader, user_cache_dir
     templates_dir = Path(__file__).parent.parent / "templates" / "player"
-    loader = TemplateLoader(str(templates_dir))
+    loader = TemplateLoader(str(templates_dir), str(user_cache_dir()))
 
     templates = loader.list_templates()
 
@@ -1092,6 +1127,7 @@ def _list_templates_command(command):
 def _show_template_command(command):
     """Show details about a specific template."""
     from pathlib import Path
+    from lib.template_loader import TemplateLoader, user_cache_dir
     if not command.args:
         return {
             "success": False,
@@ -1101,7 +1137,7 @@ def _show_template_command(command):
 
     template_name = command.args[0]
     templates_dir = Path(__file__).parent.parent / "templates" / "player"
-    loader = TemplateLoader(str(templates_dir))
+    loader = TemplateLoader(str(templates_dir), str(user_cache_dir()))
 
     template = loader.load_template(template_name)
     if not template:
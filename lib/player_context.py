@@ -6,6 +6,42 @@ from lib.player import Player
 from lib.ability_scores import ABILITY_SCORES
 from lib.player_manager import PlayerManager
 
+# Input prefixes that are treated as commands rather than a player name
+_CMD_PREFIXES = ("name", "set", "roll", "status", "save", "help", "exit")
+
+# (ability, display name) pairs in status display order
+_ABILITY_ITEMS = tuple((ability, config["display"]) for ability, config in ABILITY_SCORES.items())
+
+_HELP_TEXT = "\n".join(
+    [
+        "Player Creation Commands:",
+        "  name <name>        - Set player name",
+        "  set <ability> <#>  - Set ability score",
+        "                       Abilities: str, dex, con, int, wis, cha",
+        "  roll <dice>        - Roll dice (e.g., roll d20, roll 2d6)",
+        "  status             - Show current player status",
+        "  save               - Save player to game",
+        "  help               - Show this help message",
+        "  exit               - Exit player creation without saving",
+    ]
+)
+
+
+def _roll_4d6_drop_lowest(n: int) -> list[list[int]]:
+    """Roll n sets of six ability scores using 4d6 drop lowest.
+
+    Args:
+        n: Number of score sets to roll
+
+    Returns:
+        List of n rows, each holding six ability scores
+    """
+    randint = random.randint
+    return [
+        [sum(sorted([randint(1, 6), randint(1, 6), randint(1, 6), randint(1, 6)])[1:]) for _ in range(6)]
+        for _ in range(n)
+    ]
+
 
 class PlayerCreationContext:
     """Context for managing interactive player creation."""
@@ -72,12 +108,7 @@ class PlayerCreationContext:
         if self.player is None:
             return False, "Cannot roll abilities: no active player"
 
-        rolled_scores = []
-        for _ in range(6):
-            # Roll 4d6 and drop the lowest
-            rolls = sorted([random.randint(1, 6) for _ in range(4)])
-            score = sum(rolls[1:])  # Drop lowest, sum the rest
-            rolled_scores.append(score)
+        rolled_scores = _roll_4d6_drop_lowest(1)[0]
 
         # Store the scores for reference
         self.rolled_scores = sorted(rolled_scores, reverse=True)
@@ -96,18 +127,19 @@ class PlayerCreationContext:
         if self.player is None:
             return "No active player in creation mode"
 
-        lines = [f"Player: {self.player.name}"]
+        player = self.player
+        stats = player.stats
+        lines = [f"Player: {player.name}"]
 
         # Add ability scores (only show abilities that have been set)
-        for ability, config in ABILITY_SCORES.items():
-            score = self.player.get_ability(ability)
-            if score is not None:
-                lines.append(f"  {config['display']}: {score}")
+        lines.extend(
+            f"  {display}: {stats[ability]}" for ability, display in _ABILITY_ITEMS if ability in stats
+        )
 
-        if self.player.race:
-            lines.append(f"Race: {self.player.race}")
-        if self.player.class_type:
-            lines.append(f"Class: {self.player.class_type}")
+        if player.race:
+            lines.append(f"Race: {player.race}")
+        if player.class_type:
+            lines.append(f"Class: {player.class_type}")
 
         return "\n".join(lines)
 
@@ -147,6 +179,7 @@ class PlayerCreationHandler:
         self.game_name = game_name
         self.main_handler = main_handler  # Reference to main handler for delegating
         self.awaiting_name = True  # Track if we're waiting for a name input
+        self.finished = False  # Set once the player is saved or creation is exited
 
     def handle(self, command: str) -> str:
         """Handle a player creation command.
@@ -163,10 +196,7 @@ class PlayerCreationHandler:
 
         # If we're waiting for a name and this doesn't look like a command,
         # treat it as a name
-        if self.awaiting_name and not any(
-            command.lower().startswith(c)
-            for c in ["name", "set", "roll", "status", "save", "help", "exit"]
-        ):
+        if self.awaiting_name and not command.lower().startswith(_CMD_PREFIXES):
             success, message = self.context.set_player_name(command)
             if success:
                 self.awaiting_name = False
@@ -218,24 +248,16 @@ class PlayerCreationHandler:
 
         elif cmd == "save":
             success, message = self.context.save_player()
+            if success:
+                self.finished = True
             return message
 
         elif cmd == "help":
-            help_text = [
-                "Player Creation Commands:",
-                "  name <name>        - Set player name",
-                "  set <ability> <#>  - Set ability score",
-                "                       Abilities: str, dex, con, int, wis, cha",
-                "  roll <dice>        - Roll dice (e.g., roll d20, roll 2d6)",
-                "  status             - Show current player status",
-                "  save               - Save player to game",
-                "  help               - Show this help message",
-                "  exit               - Exit player creation without saving",
-            ]
-            return "\n".join(help_text)
+            return _HELP_TEXT
 
         elif cmd == "exit":
             self.context.player = None
+            self.finished = True
             return "Exited player creation mode without saving"
 
         else:
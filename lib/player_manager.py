@@ -1,5 +1,6 @@
 """Manager for player characters within a game."""
 
+import os
 import yaml
 from pathlib import Path
 from typing import List, Optional
@@ -110,6 +111,20 @@ class PlayerManager:
 
         return sorted(players, key=lambda p: p.name)
 
+    def list_player_names(self) -> List[str]:
+        """Get the names of all players without loading their files.
+
+        Returns:
+            Sorted list of player names
+        """
+        if not self.players_directory.exists():
+            return []
+
+        with os.scandir(self.players_directory) as entries:
+            return sorted(
+                e.name[:-5] for e in entries if e.name.endswith(".yaml") and e.is_file()
+            )
+
     def get_player(self, name: str) -> Optional[Player]:
         """Get a specific player by name.
 
@@ -147,4 +162,4 @@ class PlayerManager:
         Returns:
             Number of players
         """
-        return len(self.get_all_players())
+        return len(self.list_player_names())
@@ -1,8 +1,11 @@
 """State management system for saving and loading game state."""
 
+import atexit
+import os
+import threading
 import yaml
 from datetime import datetime
-from typing import Dict, Any
+from typing import Dict, Any, Optional
 from pathlib import Path
 
 from lib.journey_system import JourneyManager
@@ -37,31 +40,80 @@ class StateManager:
             ValueError: If save_name contains invalid characters
             OSError: If unable to write to save file
         """
-        # Validate save name
+        safe_name = self.sanitize_save_name(save_name)
+        save_path = self.write_state(safe_name, self.build_state(journey_manager))
+        return f"Game saved as '{safe_name}' at {save_path}"
+
+    @staticmethod
+    def sanitize_save_name(save_name: str) -> str:
+        """Validate a save name and strip invalid filename characters.
+
+        Args:
+            save_name: Requested save name
+
+        Returns:
+            Sanitized save name
+
+        Raises:
+            ValueError: If save_name is empty or contains only invalid characters
+        """
         if not save_name or not save_name.strip():
             raise ValueError("Save name cannot be empty")
 
-        # Remove invalid filename characters
         safe_name = "".join(
             c for c in save_name if c.isalnum() or c in (" ", "-", "_")
         ).strip()
         if not safe_name:
             raise ValueError("Save name contains only invalid characters")
+        return safe_name
+
+    @staticmethod
+    def build_state(journey_manager: JourneyManager) -> Dict[str, Any]:
+        """Build the state dictionary written to a save file.
+
+        Args:
+            journey_manager: The journey manager containing current state
 
-        # Create state dictionary
-        state = {
+        Returns:
+            State dictionary
+        """
+        return {
             "version": "1.0",
             "timestamp": datetime.now().isoformat(),
             "journey_manager": journey_manager.to_dict(),
         }
 
-        # Write to YAML file
+    def write_state(self, safe_name: str, state: Dict[str, Any]) -> Path:
+        """Write a state dictionary to its save file.
+
+        Args:
+            safe_name: Sanitized save name (see sanitize_save_name)
+            state: State dictionary (see build_state)
+
+        Returns:
+            Path of the written save file
+
+        Raises:
+            OSError: If unable to write to save file
+        """
+        # Serialize once and write to a temporary file, then atomically
+        # replace the save so a crash mid-write never leaves a corrupt file.
+        # The temporary name is per process and thread so concurrent writers
+        # of the same save never share (and truncate) one file.
         save_path = self.saves_directory / f"{safe_name}.yaml"
+        tmp_path = save_path.with_suffix(
+            f".yaml.{os.getpid()}-{threading.get_ident()}.tmp"
+        )
+        data = yaml.dump(state, default_flow_style=False, sort_keys=False).encode()
         try:
-            with open(save_path, "w") as f:
-                yaml.dump(state, f, default_flow_style=False, sort_keys=False)
-            return f"Game saved as '{safe_name}' at {save_path}"
+            with open(tmp_path, "wb") as f:
+                f.write(data)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_path, save_path)
+            return save_path
         except OSError as e:
+            tmp_path.unlink(missing_ok=True)
             raise OSError(f"Failed to save game state: {e}")
 
     def load_state(self, save_name: str) -> JourneyManager:
@@ -212,3 +264,119 @@ class StateManager:
 
         except (OSError, yaml.YAMLError) as e:
             raise ValueError(f"Failed to read save file info: {e}")
+
+
+class QueuedStateManager:
+    """Coalesces bursts of saves and writes them from a background thread.
+
+    Only the most recent state for each save name is kept, so many rapid
+    quicksaves result in a single write per flush interval. Pending saves
+    are written when the manager is closed, including at interpreter exit.
+    """
+
+    def __init__(self, state_manager: StateManager, flush_interval_ms: int = 500):
+        """Initialize the queued state manager.
+
+        Args:
+            state_manager: StateManager used to write save files
+            flush_interval_ms: How often pending saves are written (default: 500)
+        """
+        self.state_manager = state_manager
+        self.flush_interval = flush_interval_ms / 1000
+        self._pending: Dict[str, Dict[str, Any]] = {}
+        # _lock guards _pending; _flush_lock serializes flushes so writes of
+        # one save never overlap and land in the order they were queued
+        self._lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = threading.Thread(
+            target=self._run, name="QueuedStateManager", daemon=True
+        )
+        self._thread.start()
+        # The writer is a daemon thread, so drain the queue before exit
+        atexit.register(self.close)
+
+    def save_state(
+        self, journey_manager: JourneyManager, save_name: str = "quicksave"
+    ) -> str:
+        """Queue the current game state to be saved.
+
+        The state is snapshotted immediately; later saves under the same
+        name replace it until the next flush.
+
+        Args:
+            journey_manager: The journey manager containing current state
+            save_name: Name of the save file (without extension)
+
+        Returns:
+            Message naming the queued save
+
+        Raises:
+            ValueError: If save_name contains invalid characters
+            RuntimeError: If the manager has been closed
+        """
+        if self._thread is None:
+            raise RuntimeError("QueuedStateManager is closed")
+
+        safe_name = self.state_manager.sanitize_save_name(save_name)
+        state = self.state_manager.build_state(journey_manager)
+        with self._lock:
+            self._pending[safe_name] = state
+        return f"Game queued for save as '{safe_name}'"
+
+    def flush(self) -> int:
+        """Write all pending saves now.
+
+        Returns:
+            Number of save files written
+
+        Raises:
+            OSError: If unable to write a save file
+        """
+        with self._flush_lock:
+            with self._lock:
+                pending, self._pending = self._pending, {}
+            written = 0
+            for safe_name, state in pending.items():
+                try:
+                    self.state_manager.write_state(safe_name, state)
+                except BaseException:
+                    # Requeue unwritten saves unless a newer state arrived meanwhile
+                    with self._lock:
+                        for name, queued in list(pending.items())[written:]:
+                            self._pending.setdefault(name, queued)
+                    raise
+                written += 1
+            return written
+
+    def close(self) -> None:
+        """Stop the background thread and write any pending saves."""
+        if self._thread is None:
+            return
+        atexit.unregister(self.close)
+        self._stop.set()
+        self._thread.join()
+        self._thread = None
+        self.flush()
+
+    def _run(self) -> None:
+        """Flush pending saves every flush interval until closed."""
+        failing = False
+        while not self._stop.wait(self.flush_interval):
+            try:
+                self.flush()
+            except Exception as e:
+                # Keep the writer alive; failed saves were requeued and the
+                # next flush retries them. Warn once per run of failures so a
+                # lasting problem is reported without repeating every interval.
+                if not failing:
+                    print(f"Warning: Failed to write queued saves: {e}")
+                failing = True
+            else:
+                failing = False
+
+    def __enter__(self) -> "QueuedStateManager":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
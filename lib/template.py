@@ -1,12 +1,19 @@
 """Template system for player character creation workflows."""
 
-from dataclasses import dataclass, field as dataclass_field
-from typing import Any, Dict, List, Optional, Tuple
+import sys
+from dataclasses import asdict, dataclass, field as dataclass_field
+from typing import Any, Callable, Dict, FrozenSet, List, Optional, Sequence, Tuple
 
+_VALID_STEP_TYPES = frozenset(("text", "ability", "choice", "confirmation", "review"))
 
-@dataclass
+
+@dataclass(frozen=True, slots=True)
 class ValidationRules:
-    """Validation rules for a template step."""
+    """Validation rules for a template step.
+
+    Frozen because the validator is compiled from the rules once; use
+    dataclasses.replace to derive changed rules.
+    """
 
     min_length: Optional[int] = None
     max_length: Optional[int] = None
@@ -16,6 +23,35 @@ class ValidationRules:
     choices: Optional[List[str]] = None
     parse_rolls: bool = False
 
+    # Specialized validator built from the rules above; see _compile_rules
+    _compiled: Callable[[Any], Tuple[bool, Optional[str]]] = dataclass_field(
+        init=False, repr=False, compare=False
+    )
+
+    def __post_init__(self) -> None:
+        """Compile the configured rules into a validator."""
+        object.__setattr__(self, "_compiled", _compile_rules(self))
+
+    def __getstate__(self) -> List[Any]:
+        """Pickle the rule values only; the compiled closure is rebuilt."""
+        return [getattr(self, name) for name in _RULE_FIELDS]
+
+    def __setstate__(self, state: List[Any]) -> None:
+        """Restore rule values and recompile the validator."""
+        for name, value in zip(_RULE_FIELDS, state):
+            object.__setattr__(self, name, value)
+        object.__setattr__(self, "_compiled", _compile_rules(self))
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert rules to dictionary.
+
+        Returns:
+            Dictionary representation of the rules
+        """
+        data = asdict(self)
+        del data["_compiled"]
+        return data
+
     def validate(self, value: Any) -> Tuple[bool, Optional[str]]:
         """Validate a value against these rules.
 
@@ -25,30 +61,147 @@ class ValidationRules:
         Returns:
             Tuple of (is_valid, error_message)
         """
-        # Handle string validation
+        return self._compiled(value)
+
+
+_RULE_FIELDS = (
+    "min_length",
+    "max_length",
+    "min",
+    "max",
+    "pattern",
+    "choices",
+    "parse_rolls",
+)
+
+
+# Shared result for values that pass; compiled validators return it as-is
+_VALID: Tuple[bool, Optional[str]] = (True, None)
+
+
+def _compile_rules(rules: ValidationRules) -> Callable[[Any], Tuple[bool, Optional[str]]]:
+    """Build a validator that only runs the checks the rules configure.
+
+    Args:
+        rules: Validation rules to specialize
+
+    Returns:
+        Callable taking a value and returning (is_valid, error_message)
+    """
+    str_check = _compile_str_checks(rules)
+    num_check = _compile_range(rules.min, rules.max, "Minimum value is", "Maximum value is")
+
+    # With only one kind of check configured, values of the other kind always
+    # pass, so the type test and the check collapse into one closure
+    if str_check is None and num_check is None:
+        return _accept
+    if str_check is None:
+
+        def validate_number(value: Any) -> Tuple[bool, Optional[str]]:
+            if isinstance(value, (int, float)):
+                return num_check(value)
+            return _VALID
+
+        return validate_number
+    if num_check is None:
+
+        def validate_str(value: Any) -> Tuple[bool, Optional[str]]:
+            if isinstance(value, str):
+                return str_check(value)
+            return _VALID
+
+        return validate_str
+
+    def validate(value: Any) -> Tuple[bool, Optional[str]]:
         if isinstance(value, str):
-            if self.min_length is not None and len(value) < self.min_length:
-                return False, f"Minimum length is {self.min_length}"
-            if self.max_length is not None and len(value) > self.max_length:
-                return False, f"Maximum length is {self.max_length}"
-            if self.choices is not None and value not in self.choices:
-                return False, f"Must be one of: {', '.join(self.choices)}"
-            return True, None
-
-        # Handle numeric validation
+            return str_check(value)
         if isinstance(value, (int, float)):
-            if self.min is not None and value < self.min:
-                return False, f"Minimum value is {self.min}"
-            if self.max is not None and value > self.max:
-                return False, f"Maximum value is {self.max}"
-            return True, None
+            return num_check(value)
+        return _VALID
 
-        return True, None
+    return validate
+
+
+def _compile_range(
+    low: Optional[Any], high: Optional[Any], low_message: str, high_message: str
+) -> Optional[Callable[[Any], Tuple[bool, Optional[str]]]]:
+    """Build a check for an inclusive range with optional bounds.
+
+    Failure results are built once here rather than on every call.
+
+    Args:
+        low: Minimum allowed value, or None
+        high: Maximum allowed value, or None
+        low_message: Message prefix when the value is below low
+        high_message: Message prefix when the value is above high
+
+    Returns:
+        Callable taking a value and returning (is_valid, error_message), or
+        None if neither bound is set
+    """
+    below = (False, f"{low_message} {low}")
+    above = (False, f"{high_message} {high}")
+    if low is None and high is None:
+        return None
+    if high is None:
+        return lambda v: below if v < low else _VALID
+    if low is None:
+        return lambda v: above if v > high else _VALID
+    return lambda v: below if v < low else above if v > high else _VALID
+
+
+def _compile_str_checks(
+    rules: ValidationRules,
+) -> Optional[Callable[[str], Tuple[bool, Optional[str]]]]:
+    """Build the string checks: length bounds first, then allowed choices.
+
+    Args:
+        rules: Validation rules to specialize
+
+    Returns:
+        Callable taking a string and returning (is_valid, error_message), or
+        None if no string checks are configured
+    """
+    length_check = _compile_range(
+        rules.min_length, rules.max_length, "Minimum length is", "Maximum length is"
+    )
+    if rules.choices is None:
+        if length_check is None:
+            return None
+        return lambda v: length_check(len(v))
+
+    allowed = frozenset(rules.choices)
+    not_allowed = (False, f"Must be one of: {', '.join(rules.choices)}")
+    if length_check is None:
+        return lambda v: _VALID if v in allowed else not_allowed
 
+    def check(value: str) -> Tuple[bool, Optional[str]]:
+        result = length_check(len(value))
+        if result is _VALID and value not in allowed:
+            return not_allowed
+        return result
 
-@dataclass
+    return check
+
+
+def _accept(value: Any) -> Tuple[bool, Optional[str]]:
+    """Validator for rules that configure no checks."""
+    return _VALID
+
+
+def _intern_str(value: Any) -> Any:
+    """Intern YAML-sourced strings that are compared often (step IDs and types)."""
+    return sys.intern(value) if isinstance(value, str) else value
+
+
+@dataclass(slots=True)
 class TemplateStep:
-    """Represents a single step in a player creation template."""
+    """Represents a single step in a player creation template.
+
+    Steps are treated as immutable once built: values derived from the
+    fields are computed at construction, so use dataclasses.replace to
+    change a step.
+    """
 
     id: str
     prompt: str
@@ -58,6 +211,17 @@ class TemplateStep:
     macros_enabled: bool = False
     validation: ValidationRules = dataclass_field(default_factory=ValidationRules)
     choices: Optional[List[str]] = None
+    # Set form of choices for membership tests; the list keeps display order
+    choices_set: Optional[FrozenSet[str]] = dataclass_field(
+        init=False, repr=False, compare=False, default=None
+    )
+    # Prompt followed by its help text, as shown to the user
+    display_prompt: str = dataclass_field(init=False, repr=False, compare=False, default="")
+
+    def __post_init__(self) -> None:
+        """Precompute the choice set and display prompt."""
+        self.choices_set = frozenset(self.choices) if self.choices else None
+        self.display_prompt = f"{self.prompt}\n({self.help})" if self.help else self.prompt
 
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "TemplateStep":
@@ -69,27 +233,7 @@ class TemplateStep:
         Returns:
             TemplateStep instance
         """
-        validation_data = data.get("validation", {})
-        validation = ValidationRules(
-            min_length=validation_data.get("min_length"),
-            max_length=validation_data.get("max_length"),
-            min=validation_data.get("min"),
-            max=validation_data.get("max"),
-            pattern=validation_data.get("pattern"),
-            choices=validation_data.get("choices"),
-            parse_rolls=validation_data.get("parse_rolls", False),
-        )
-
-        return cls(
-            id=data.get("id", ""),
-            prompt=data.get("prompt", ""),
-            type=data.get("type", "text"),
-            field=data.get("field"),
-            help=data.get("help"),
-            macros_enabled=data.get("macros_enabled", False),
-            validation=validation,
-            choices=data.get("choices"),
-        )
+        return _step_from_dict(data)
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary.
@@ -104,28 +248,87 @@ class TemplateStep:
             "field": self.field,
             "help": self.help,
             "macros_enabled": self.macros_enabled,
-            "validation": {
-                "min_length": self.validation.min_length,
-                "max_length": self.validation.max_length,
-                "min": self.validation.min,
-                "max": self.validation.max,
-                "pattern": self.validation.pattern,
-                "choices": self.validation.choices,
-                "parse_rolls": self.validation.parse_rolls,
-            },
+            "validation": self.validation.to_dict(),
             "choices": self.choices,
         }
 
 
-@dataclass
+# Shared by steps whose definition has no validation block
+_NO_RULES = ValidationRules()
+
+
+def _step_from_dict(data: Dict[str, Any]) -> TemplateStep:
+    """Build a TemplateStep from its dictionary definition.
+
+    Module-level so Template.from_dict can call it per step without a
+    classmethod lookup.
+
+    Args:
+        data: Dictionary with step definition
+
+    Returns:
+        TemplateStep instance
+    """
+    # Most steps have no validation block; skip the seven lookups for them
+    validation_data = data.get("validation")
+    if validation_data:
+        validation = ValidationRules(
+            min_length=validation_data.get("min_length"),
+            max_length=validation_data.get("max_length"),
+            min=validation_data.get("min"),
+            max=validation_data.get("max"),
+            pattern=validation_data.get("pattern"),
+            choices=validation_data.get("choices"),
+            parse_rolls=validation_data.get("parse_rolls", False),
+        )
+    else:
+        # Rules are frozen, so steps without a validation block share one
+        validation = _NO_RULES
+
+    # id and type are present in well-formed templates; subscript them
+    # directly and only fall back to defaults when one is missing
+    try:
+        step_id = data["id"]
+        step_type = data["type"]
+    except KeyError:
+        step_id = data.get("id", "")
+        step_type = data.get("type", "text")
+
+    return TemplateStep(
+        id=_intern_str(step_id),
+        prompt=data.get("prompt", ""),
+        type=_intern_str(step_type),
+        field=data.get("field"),
+        help=data.get("help"),
+        macros_enabled=data.get("macros_enabled", False),
+        validation=validation,
+        choices=data.get("choices"),
+    )
+
+
+@dataclass(slots=True)
 class Template:
-    """Represents a complete player creation template."""
+    """Represents a complete player creation template.
+
+    Steps are stored as a tuple so get_step_by_id's index cannot drift from
+    them; assigning new steps rebuilds the index.
+    """
 
     name: str
     version: str
     description: str
-    steps: List[TemplateStep]
+    steps: Sequence[TemplateStep]
     metadata: Dict[str, Any] = dataclass_field(default_factory=dict)
+    # Steps by ID for get_step_by_id (first step wins on duplicates); set
+    # whenever steps is assigned
+    _by_id: Dict[str, TemplateStep] = dataclass_field(init=False, repr=False, compare=False)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        """Set a field, freezing steps into a tuple and re-indexing them."""
+        if name == "steps":
+            value = tuple(value)
+            object.__setattr__(self, "_by_id", {step.id: step for step in reversed(value)})
+        object.__setattr__(self, name, value)
 
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "Template":
@@ -147,12 +350,16 @@ class Template:
         if "steps" not in data or not data["steps"]:
             raise ValueError("Template must have at least one step")
 
-        steps = [TemplateStep.from_dict(step_data) for step_data in data["steps"]]
+        step_from_dict = _step_from_dict
+        steps = [step_from_dict(step_data) for step_data in data["steps"]]
 
-        # Validate step IDs are unique
-        step_ids = [step.id for step in steps]
-        if len(step_ids) != len(set(step_ids)):
-            raise ValueError("Template steps must have unique IDs")
+        # Validate step IDs are unique, stopping at the first duplicate
+        seen_ids = set()
+        add_id = seen_ids.add
+        for step in steps:
+            if step.id in seen_ids:
+                raise ValueError("Template steps must have unique IDs")
+            add_id(step.id)
 
         return cls(
             name=data["name"],
@@ -195,7 +402,7 @@ class Template:
                 return False, "All steps must have unique IDs"
             if not step.prompt:
                 return False, f"Step '{step.id}' must have a prompt"
-            if step.type not in ["text", "ability", "choice", "confirmation", "review"]:
+            if step.type not in _VALID_STEP_TYPES:
                 return False, f"Step '{step.id}' has invalid type '{step.type}'"
 
         return True, None
@@ -222,10 +429,7 @@ class Template:
         Returns:
             TemplateStep or None if not found
         """
-        for step in self.steps:
-            if step.id == step_id:
-                return step
-        return None
+        return self._by_id.get(step_id)
 
     def step_count(self) -> int:
         """Get total number of steps.
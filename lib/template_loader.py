@@ -1,43 +1,136 @@
 """Template loading and management system."""
 
+import hashlib
+import os
+from concurrent.futures import ThreadPoolExecutor
+import pickle
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from typing import Any, Dict, List, Optional, Tuple
 
 import yaml
 
 from lib.template import Template
 
+# Prefer libyaml's C loader when PyYAML was built with it
+_Loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+# Parsed templates are pickled under the per-user cache directory, keyed by
+# the source file's mtime and size. Bump _CACHE_VERSION whenever the pickled
+# Template layout changes.
+_CACHE_APP_DIRNAME = "roleplaying_toolkit"
+_CACHE_VERSION = 8
+
+# Upper bound on threads used by reload_templates
+_MAX_LOAD_WORKERS = 8
+
+
+def user_cache_dir() -> Path:
+    """Get the per-user directory for cached templates.
+
+    Returns:
+        ``$XDG_CACHE_HOME/roleplaying_toolkit/templates``, falling back to
+        ``~/.cache`` when XDG_CACHE_HOME is unset
+    """
+    base = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return Path(base) / _CACHE_APP_DIRNAME / "templates"
+
 
 class TemplateLoader:
     """Loads and manages player creation templates."""
 
-    def __init__(self, templates_dir: str):
+    def __init__(self, templates_dir: str, cache_dir: Optional[str] = None):
         """Initialize template loader.
 
         Args:
             templates_dir: Directory containing template YAML files
+            cache_dir: Directory for pickled parse results, or None to disable
+                caching. Cached entries are unpickled, so this must be a
+                directory only the current user can write to (see
+                user_cache_dir).
         """
         self.templates_dir = Path(templates_dir)
+        self.cache_dir = Path(cache_dir) if cache_dir is not None else None
+        # Templates are parsed lazily on first load_template() and kept here
         self.templates: Dict[str, Template] = {}
-        self._load_all_templates()
+        # Names that failed to load, with the (mtime_ns, size) they failed at
+        self._failed: Dict[str, Tuple[int, int]] = {}
 
     def _load_all_templates(self) -> None:
         """Load all templates from templates directory."""
         self.templates = {}
+        self._failed = {}
 
-        if not self.templates_dir.exists():
+        # Look for YAML files in the templates directory
+        names = self.list_templates()
+        if not names:
             return
 
-        # Look for YAML files in the templates directory
-        for yaml_file in self.templates_dir.glob("*.yaml"):
-            template_name = yaml_file.stem
-            try:
-                template = self._load_template_file(yaml_file)
-                if template:
-                    self.templates[template_name] = template
-            except Exception as e:
-                # Log error but continue loading other templates
-                print(f"Warning: Failed to load template '{template_name}': {e}")
+        # Files are independent, so parse them concurrently; file reads and
+        # libyaml parsing overlap across threads
+        with ThreadPoolExecutor(max_workers=min(_MAX_LOAD_WORKERS, len(names))) as pool:
+            templates = list(pool.map(self._parse_named_template, names))
+
+        for name, template in zip(names, templates):
+            if template:
+                self.templates[name] = template
+
+    def _parse_named_template(self, name: str) -> Optional[Template]:
+        """Parse a template by name, reporting failures.
+
+        Args:
+            name: Template name (without .yaml extension)
+
+        Returns:
+            Template instance or None if missing or invalid
+        """
+        file_path = self.templates_dir / f"{name}.yaml"
+        try:
+            return self._load_template_file(file_path)
+        except Exception as e:
+            # Log error but keep going; the template is treated as unavailable
+            # until the file changes
+            print(f"Warning: Failed to load template '{name}': {e}")
+            signature = self._file_signature(file_path)
+            if signature is not None:
+                self._failed[name] = signature
+            return None
+
+    @staticmethod
+    def _file_signature(file_path: Path) -> Optional[Tuple[int, int]]:
+        """Get the (mtime_ns, size) of a file, or None if it cannot be read."""
+        try:
+            stat = os.stat(file_path)
+        except OSError:
+            return None
+        return stat.st_mtime_ns, stat.st_size
+
+    def _is_known_invalid(self, name: str) -> bool:
+        """Check whether a template already failed to load in its current form.
+
+        Args:
+            name: Template name (without .yaml extension)
+
+        Returns:
+            True if the template failed before and its file is unchanged
+        """
+        signature = self._failed.get(name)
+        return signature is not None and signature == self._file_signature(
+            self.templates_dir / f"{name}.yaml"
+        )
+
+    def _load_named_template(self, name: str) -> Optional[Template]:
+        """Parse a template by name and remember it.
+
+        Args:
+            name: Template name (without .yaml extension)
+
+        Returns:
+            Template instance or None if missing or invalid
+        """
+        template = self._parse_named_template(name)
+        if template:
+            self.templates[name] = template
+        return template
 
     def _load_template_file(self, file_path: Path) -> Optional[Template]:
         """Load a single template file.
@@ -52,8 +145,19 @@ class TemplateLoader:
             ValueError: If template structure is invalid
             yaml.YAMLError: If YAML parsing fails
         """
-        with open(file_path, "r") as f:
-            data = yaml.safe_load(f)
+        cache_path = None
+        if self.cache_dir is not None:
+            stat = os.stat(file_path)
+            cache_key = (_CACHE_VERSION, stat.st_mtime_ns, stat.st_size)
+            cache_path = self._cache_path(Path(file_path))
+
+            template = self._read_cache(cache_path, cache_key)
+            if template is not None:
+                return template
+
+        # Hand libyaml raw bytes so it decodes in C instead of via TextIOWrapper
+        with open(file_path, "rb") as f:
+            data = yaml.load(f, Loader=_Loader)
 
         if not data:
             raise ValueError(f"Template file {file_path} is empty")
@@ -65,8 +169,73 @@ class TemplateLoader:
         if not is_valid:
             raise ValueError(f"Template validation failed: {error_msg}")
 
+        if cache_path is not None:
+            self._write_cache(cache_path, cache_key, template)
         return template
 
+    def _cache_path(self, file_path: Path) -> Path:
+        """Get the cache file for a template file.
+
+        The name includes a digest of the resolved source path, so templates
+        with the same name in different directories do not share an entry.
+
+        Args:
+            file_path: Path to YAML template file
+
+        Returns:
+            Path to the pickle cache file
+        """
+        digest = hashlib.sha1(str(file_path.resolve()).encode()).hexdigest()[:16]
+        return self.cache_dir / f"{file_path.stem}-{digest}.pkl"
+
+    @staticmethod
+    def _read_cache(cache_path: Path, cache_key: Tuple[Any, ...]) -> Optional[Template]:
+        """Read a cached template if it matches the source file.
+
+        Args:
+            cache_path: Path to the pickle cache file
+            cache_key: (cache version, mtime_ns, size) of the source YAML file
+
+        Returns:
+            Cached Template or None on a miss or unreadable cache
+        """
+        try:
+            with open(cache_path, "rb") as f:
+                # The key is pickled ahead of the template so stale entries
+                # are rejected without unpickling the template at all
+                if pickle.load(f) != cache_key:
+                    return None
+                template = pickle.load(f)
+        except Exception:
+            # The cache is only an optimization; any unreadable entry (a
+            # truncated file, a class that no longer imports) means a re-parse
+            return None
+
+        return template if isinstance(template, Template) else None
+
+    @staticmethod
+    def _write_cache(cache_path: Path, cache_key: Tuple[Any, ...], template: Template) -> None:
+        """Write a parsed template to the cache, ignoring failures.
+
+        Args:
+            cache_path: Path to the pickle cache file
+            cache_key: (cache version, mtime_ns, size) of the source YAML file
+            template: Parsed and validated template
+        """
+        tmp_path = cache_path.with_suffix(".pkl.tmp")
+        try:
+            cache_path.parent.mkdir(mode=0o700, parents=True, exist_ok=True)
+            with open(tmp_path, "wb") as f:
+                pickle.dump(cache_key, f, protocol=pickle.HIGHEST_PROTOCOL)
+                pickle.dump(template, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, cache_path)
+        except (OSError, pickle.PickleError):
+            # The cache is only an optimization; a read-only directory is fine
+            try:
+                tmp_path.unlink(missing_ok=True)
+            except OSError:
+                pass
+
     def load_template(self, name: str) -> Optional[Template]:
         """Load a template by name.
 
@@ -76,15 +245,37 @@ class TemplateLoader:
         Returns:
             Template instance or None if not found
         """
-        return self.templates.get(name)
+        template = self.templates.get(name)
+        if template is not None:
+            return template
+
+        # Only plain names inside the templates directory are valid
+        if not name or Path(name).name != name:
+            return None
+        if not (self.templates_dir / f"{name}.yaml").is_file():
+            return None
+        if self._is_known_invalid(name):
+            return None
+
+        return self._load_named_template(name)
 
     def list_templates(self) -> List[str]:
-        """List available template names.
+        """List available template names without parsing them.
+
+        Every ``*.yaml`` file is listed except those that already failed to
+        load; a template that has never been loaded is not validated here.
+        Call reload_templates() first for a fully validated list.
 
         Returns:
             Sorted list of template names
         """
-        return sorted(self.templates.keys())
+        if not self.templates_dir.exists():
+            return []
+        return sorted(
+            p.stem
+            for p in self.templates_dir.glob("*.yaml")
+            if not self._is_known_invalid(p.stem)
+        )
 
     def get_template_info(self, name: str) -> Optional[Dict[str, str]]:
         """Get information about a template.
@@ -131,8 +322,8 @@ class TemplateLoader:
             Tuple of (is_valid, error_message)
         """
         try:
-            with open(file_path, "r") as f:
-                data = yaml.safe_load(f)
+            with open(file_path, "rb") as f:
+                data = yaml.load(f, Loader=_Loader)
 
             if not data:
                 return False, "Template file is empty"
@@ -146,9 +337,9 @@ class TemplateLoader:
             return False, str(e)
 
     def template_count(self) -> int:
-        """Get number of loaded templates.
+        """Get number of available templates, as counted by list_templates().
 
         Returns:
             Number of templates
         """
-        return len(self.templates)
+        return len(self.list_templates())
@@ -1,22 +1,32 @@
 """Macro system for template-based player creation."""
 
+import heapq
 import random
 import re
+from functools import lru_cache
 from typing import Optional, Tuple, Union
 
+# All macros in one pattern; the outer group names match the macro types,
+# so a single match() both recognizes the macro and tells which one it is
+_MACRO_RE = re.compile(
+    r"(?P<roll_top>@roll-top\s+(?P<rt_keep>\d+)\s+(?P<rt_n>\d+)d(?P<rt_s>\d+)"
+    r"(?:\+(?P<rt_p>\d+))?(?:-(?P<rt_m>\d+))?)"
+    r"|(?P<roll>@roll\s+(?P<r_n>\d+)?d(?P<r_s>\d+)(?:\+(?P<r_p>\d+))?(?:-(?P<r_m>\d+))?)"
+    r"|(?P<sum>@sum\s+(?P<s_vals>[\d\s+\-]+))",
+    re.IGNORECASE,
+)
+_MACRO_MATCH = _MACRO_RE.match
+
+
+@lru_cache(maxsize=32)
+def _die_faces(dice_size: int) -> range:
+    """Get the (cached) range of faces for a die with dice_size sides."""
+    return range(1, dice_size + 1)
+
 
 class MacroProcessor:
     """Processes and executes macros in template inputs."""
 
-    # Macro patterns
-    ROLL_TOP_PATTERN = re.compile(
-        r"@roll-top\s+(\d+)\s+(\d+)d(\d+)(?:\+(\d+))?(?:\-(\d+))?", re.IGNORECASE
-    )
-    ROLL_PATTERN = re.compile(
-        r"@roll\s+(\d+)?d(\d+)(?:\+(\d+))?(?:\-(\d+))?", re.IGNORECASE
-    )
-    SUM_PATTERN = re.compile(r"@sum\s+([\d\s\+\-]+)", re.IGNORECASE)
-
     @staticmethod
     def parse_macro(input_str: str) -> Optional[Tuple[str, dict]]:
         """Parse a macro from input string.
@@ -34,54 +44,49 @@ class MacroProcessor:
         """
         input_str = input_str.strip()
 
-        # Check for roll-top macro
-        match = MacroProcessor.ROLL_TOP_PATTERN.match(input_str)
-        if match:
-            keep = int(match.group(1))
-            num_dice = int(match.group(2))
-            dice_size = int(match.group(3))
-            plus_mod = int(match.group(4)) if match.group(4) else 0
-            minus_mod = int(match.group(5)) if match.group(5) else 0
-            modifier = plus_mod - minus_mod
+        # Every macro starts with '@'; skip the regex for plain answers
+        if not input_str.startswith("@"):
+            return None
 
+        match = _MACRO_MATCH(input_str)
+        if not match:
+            return None
+
+        macro_type = match.lastgroup
+        groups = match.groupdict()
+
+        if macro_type == "roll_top":
+            plus_mod = int(groups["rt_p"]) if groups["rt_p"] else 0
+            minus_mod = int(groups["rt_m"]) if groups["rt_m"] else 0
             return "roll_top", {
-                "keep": keep,
-                "num_dice": num_dice,
-                "dice_size": dice_size,
-                "modifier": modifier,
+                "keep": int(groups["rt_keep"]),
+                "num_dice": int(groups["rt_n"]),
+                "dice_size": int(groups["rt_s"]),
+                "modifier": plus_mod - minus_mod,
             }
 
-        # Check for roll macro
-        match = MacroProcessor.ROLL_PATTERN.match(input_str)
-        if match:
-            num_dice = int(match.group(1)) if match.group(1) else 1
-            dice_size = int(match.group(2))
-            plus_mod = int(match.group(3)) if match.group(3) else 0
-            minus_mod = int(match.group(4)) if match.group(4) else 0
-            modifier = plus_mod - minus_mod
-
+        if macro_type == "roll":
+            plus_mod = int(groups["r_p"]) if groups["r_p"] else 0
+            minus_mod = int(groups["r_m"]) if groups["r_m"] else 0
             return "roll", {
-                "num_dice": num_dice,
-                "dice_size": dice_size,
-                "modifier": modifier,
+                "num_dice": int(groups["r_n"]) if groups["r_n"] else 1,
+                "dice_size": int(groups["r_s"]),
+                "modifier": plus_mod - minus_mod,
             }
 
-        # Check for sum macro
-        match = MacroProcessor.SUM_PATTERN.match(input_str)
-        if match:
-            return "sum", {"values_str": match.group(1)}
-
-        return None
+        return "sum", {"values_str": groups["s_vals"]}
 
     @staticmethod
     def execute(
-        macro_type: str, params: dict
+        macro_type: str, params: dict, emit_message: bool = True
     ) -> Tuple[bool, Union[int, str], str]:
         """Execute a macro.
 
         Args:
             macro_type: Type of macro to execute
             params: Macro parameters
+            emit_message: If False, skip formatting the success message and
+                return "" instead (for callers that only need the value)
 
         Returns:
             Tuple of (success, result_value, message)
@@ -89,16 +94,18 @@ class MacroProcessor:
                 message: Human-readable message describing the result
         """
         if macro_type == "roll_top":
-            return MacroProcessor._execute_roll_top(params)
+            return MacroProcessor._execute_roll_top(params, emit_message)
         elif macro_type == "roll":
-            return MacroProcessor._execute_roll(params)
+            return MacroProcessor._execute_roll(params, emit_message)
         elif macro_type == "sum":
-            return MacroProcessor._execute_sum(params)
+            return MacroProcessor._execute_sum(params, emit_message)
         else:
             return False, "Unknown macro type", f"Unknown macro type: {macro_type}"
 
     @staticmethod
-    def _execute_roll_top(params: dict) -> Tuple[bool, Union[int, str], str]:
+    def _execute_roll_top(
+        params: dict, emit_message: bool = True
+    ) -> Tuple[bool, Union[int, str], str]:
         """Execute @roll-top macro.
 
         Example: @roll-top 3 4d6 (roll 4d6, keep top 3)
@@ -119,12 +126,17 @@ class MacroProcessor:
         if num_dice > 100:
             return False, "Too many dice", "Cannot roll more than 100 dice"
 
+        if dice_size < 1:
+            return False, "Invalid dice size", "Dice size must be at least 1"
+
         # Roll the dice
-        rolls = [random.randint(1, dice_size) for _ in range(num_dice)]
-        rolls_sorted = sorted(rolls, reverse=True)
-        kept_rolls = rolls_sorted[:keep]
+        rolls = random.choices(_die_faces(dice_size), k=num_dice)
+        kept_rolls = heapq.nlargest(keep, rolls)
         total = sum(kept_rolls) + modifier
 
+        if not emit_message:
+            return True, total, ""
+
         # Format message
         rolls_str = ", ".join(str(r) for r in rolls)
         kept_str = ", ".join(str(r) for r in kept_rolls)
@@ -142,7 +154,9 @@ class MacroProcessor:
         return True, total, message
 
     @staticmethod
-    def _execute_roll(params: dict) -> Tuple[bool, Union[int, str], str]:
+    def _execute_roll(
+        params: dict, emit_message: bool = True
+    ) -> Tuple[bool, Union[int, str], str]:
         """Execute @roll macro.
 
         Example: @roll d20 (roll 1d20)
@@ -159,10 +173,16 @@ class MacroProcessor:
         if dice_size > 1000:
             return False, "Invalid dice size", "Dice size must be <= 1000"
 
+        if dice_size < 1:
+            return False, "Invalid dice size", "Dice size must be at least 1"
+
         # Roll the dice
-        rolls = [random.randint(1, dice_size) for _ in range(num_dice)]
+        rolls = random.choices(_die_faces(dice_size), k=num_dice)
         total = sum(rolls) + modifier
 
+        if not emit_message:
+            return True, total, ""
+
         # Format message
         if num_dice == 1:
             rolls_str = str(rolls[0])
@@ -183,28 +203,70 @@ class MacroProcessor:
         return True, total, message
 
     @staticmethod
-    def _execute_sum(params: dict) -> Tuple[bool, Union[int, str], str]:
+    def _execute_sum(
+        params: dict, emit_message: bool = True
+    ) -> Tuple[bool, Union[int, str], str]:
         """Execute @sum macro.
 
         Example: @sum 14 2 3 (sum 14+2+3)
         """
         values_str = params.get("values_str", "")
 
-        # Parse the values
+        values_str = values_str.strip()
         try:
-            # Replace operators and parse
-            values_str = values_str.strip()
-            total = eval(values_str, {"__builtins__": {}}, {})
+            total = MacroProcessor._parse_sum(values_str)
+        except ValueError as e:
+            return False, "Invalid sum", f"Cannot calculate sum: {e}"
 
-            if not isinstance(total, (int, float)):
-                return False, "Invalid sum", "Sum must result in a number"
+        if not emit_message:
+            return True, total, ""
 
-            total = int(total)
-            message = f"Sum: {values_str} = {total}"
-            return True, total, message
+        message = f"Sum: {values_str} = {total}"
+        return True, total, message
 
-        except Exception as e:
-            return False, "Invalid sum", f"Cannot calculate sum: {e}"
+    @staticmethod
+    def _parse_sum(values_str: str) -> int:
+        """Add up integers separated by whitespace, '+' or '-'.
+
+        Each '-' flips the sign of the next number, so "10 - -5" is 15.
+
+        Args:
+            values_str: Expression such as "14 2 3" or "10+5-2"
+
+        Returns:
+            Sum of the signed integers
+
+        Raises:
+            ValueError: If the expression contains anything else or ends in an operator
+        """
+        total = 0
+        sign = 1
+        digits = ""
+        terms = 0
+        expecting_number = True
+
+        # Trailing space flushes the final number
+        for ch in values_str + " ":
+            if "0" <= ch <= "9":
+                digits += ch
+                continue
+            if digits:
+                total += sign * int(digits)
+                terms += 1
+                digits = ""
+                sign = 1
+                expecting_number = False
+            if ch == "-":
+                sign = -sign
+                expecting_number = True
+            elif ch == "+":
+                expecting_number = True
+            elif not ch.isspace():
+                raise ValueError(f"unexpected character '{ch}'")
+
+        if terms == 0 or expecting_number:
+            raise ValueError("expected a number")
+        return total
 
     @staticmethod
     def process_input(input_str: str) -> Tuple[bool, Union[int, str], str]:
@@ -1,15 +1,61 @@
 """Template-based player creation context and handler."""
 
-from typing import Optional, Tuple
+from typing import Any, List, Optional, Tuple
 
 from lib.template import Template
 from lib.template_macros import MacroProcessor
 from lib.player import Player
+from lib.player_manager import PlayerManager
+
+# Placeholder for steps that have not been answered
+_UNSET = object()
+
+# Map ability shorthand used in template fields (str -> strength)
+_ABILITY_MAP = {
+    "str": "strength",
+    "dex": "dexterity",
+    "con": "constitution",
+    "int": "intelligence",
+    "wis": "wisdom",
+    "cha": "charisma",
+}
+
+_HELP_TEXT = "\n".join(
+    [
+        "Template Player Creation Commands:",
+        "  <answer>        - Answer the current step",
+        "  @roll d20       - Roll dice (if enabled for this step)",
+        "  @roll-top 3 4d6 - Roll 4d6, keep top 3",
+        "  @sum 10+5       - Calculate sum",
+        "  status          - Show current player status",
+        "  show            - Show current step details",
+        "  back            - Go to previous step",
+        "  cancel          - Cancel without saving",
+        "  help            - Show this help message",
+    ]
+)
 
 
 class TemplatePlayerCreationHandler:
     """Manages interactive player creation using a template."""
 
+    # Built-in commands (matched case-insensitively) -> handler method names
+    _COMMANDS = {
+        "help": "_handle_help",
+        "status": "_handle_status",
+        "back": "_handle_back",
+        "cancel": "_handle_cancel",
+        "show": "_handle_show",
+    }
+    # Longer input cannot be a command, so it skips the lowercase-and-lookup
+    _MAX_COMMAND_LEN = max(map(len, _COMMANDS))
+
+    # Answers accepted by confirmation steps -> handler method names
+    _CONFIRMATIONS = {
+        "yes": "_handle_confirmation_yes",
+        "no": "_handle_confirmation_no",
+    }
+
     def __init__(self, template: Template, game_manager, main_handler=None):
         """Initialize template-based player creation handler.
 
@@ -19,11 +65,16 @@ class TemplatePlayerCreationHandler:
             main_handler: Reference to main command handler for delegating dice rolls
         """
         self.template = template
+        # Templates are not modified after loading, so the count is fixed
+        self._step_count = template.step_count()
         self.game_manager = game_manager
         self.main_handler = main_handler
         self.player: Optional[Player] = None
         self.current_step_index = 0
         self.answers: dict = {}  # Store answers indexed by step ID
+        # Answers by step position (_UNSET until answered), for status and back
+        self._answers_by_pos: List[Any] = [_UNSET] * self._step_count
+        self.finished = False  # Set once creation is cancelled
 
     def get_welcome_message(self) -> str:
         """Get welcome message for template.
@@ -31,19 +82,15 @@ class TemplatePlayerCreationHandler:
         Returns:
             Welcome message
         """
-        msg = f"Starting player creation using template '{self.template.name}'.\n"
-        msg += f"Description: {self.template.description}\n"
-        msg += f"Total steps: {self.template.step_count()}\n"
-        msg += "Type 'help' for available commands.\n"
-        msg += "\n"
-
         current_step = self.get_current_step()
-        if current_step:
-            msg += f"{current_step.prompt}"
-            if current_step.help:
-                msg += f"\n({current_step.help})"
-
-        return msg
+        return (
+            f"Starting player creation using template '{self.template.name}'.\n"
+            f"Description: {self.template.description}\n"
+            f"Total steps: {self._step_count}\n"
+            "Type 'help' for available commands.\n"
+            "\n"
+            f"{current_step.display_prompt if current_step else ''}"
+        )
 
     def get_current_step(self):
         """Get current template step.
@@ -68,16 +115,10 @@ class TemplatePlayerCreationHandler:
             return "Enter a command or type 'help' for available commands"
 
         # Handle built-in commands
-        if input_str.lower() == "help":
-            return self._handle_help()
-        elif input_str.lower() == "status":
-            return self._handle_status()
-        elif input_str.lower() == "back":
-            return self._handle_back()
-        elif input_str.lower() == "cancel":
-            return self._handle_cancel()
-        elif input_str.lower() == "show":
-            return self._handle_show()
+        if len(input_str) <= self._MAX_COMMAND_LEN:
+            method_name = self._COMMANDS.get(input_str.lower())
+            if method_name is not None:
+                return getattr(self, method_name)()
 
         # Handle template step input
         return self._handle_step_input(input_str)
@@ -103,12 +144,10 @@ class TemplatePlayerCreationHandler:
 
         # For confirmation steps
         if current_step.type == "confirmation":
-            if input_str.lower() == "yes":
-                return self._handle_confirmation_yes(current_step)
-            elif input_str.lower() == "no":
-                return self._handle_confirmation_no(current_step)
-            else:
+            method_name = self._CONFIRMATIONS.get(input_str.lower())
+            if method_name is None:
                 return "Please answer 'yes' or 'no'"
+            return getattr(self, method_name)(current_step)
 
         # For regular steps, process input
         return self._process_step_answer(current_step, input_str)
@@ -123,8 +162,8 @@ class TemplatePlayerCreationHandler:
         Returns:
             Response message
         """
-        # Check if input is a macro
-        if step.macros_enabled:
+        # Check if input is a macro (all macros start with '@')
+        if step.macros_enabled and input_str.startswith("@"):
             macro = MacroProcessor.parse_macro(input_str)
             if macro:
                 macro_type, params = macro
@@ -133,7 +172,7 @@ class TemplatePlayerCreationHandler:
                 )
                 if success:
                     # If user confirmed with macro result, advance
-                    self.answers[step.id] = value
+                    self._record_answer(step, value)
                     self._apply_step_answer(step, value)
                     self.current_step_index += 1
                     return f"{message}\n\n{self._advance_to_next_step()}"
@@ -147,7 +186,7 @@ class TemplatePlayerCreationHandler:
             return f"Invalid input: {error}"
 
         # Store answer and apply to player
-        self.answers[step.id] = value
+        self._record_answer(step, value)
         self._apply_step_answer(step, value)
 
         # Advance to next step
@@ -164,32 +203,55 @@ class TemplatePlayerCreationHandler:
         Returns:
             Tuple of (is_valid, parsed_value, error_message)
         """
-        # Handle text inputs
-        if step.type == "text":
-            is_valid, error = step.validation.validate(answer_str)
-            if not is_valid:
-                return False, None, error
-            return True, answer_str, None
-
-        # Handle ability scores
-        if step.type == "ability":
-            try:
-                value = int(answer_str)
-                is_valid, error = step.validation.validate(value)
-                if not is_valid:
-                    return False, None, error
-                return True, value, None
-            except ValueError:
-                return False, None, "Please enter a valid number"
-
-        # Handle choice
-        if step.type == "choice":
-            if step.choices and answer_str not in step.choices:
-                choices_str = ", ".join(step.choices)
-                return False, None, f"Must be one of: {choices_str}"
-            return True, answer_str, None
-
-        return False, None, f"Unknown step type: {step.type}"
+        parser = self._PARSERS.get(step.type)
+        if parser is None:
+            return False, None, f"Unknown step type: {step.type}"
+        return parser(step, answer_str)
+
+    @staticmethod
+    def _parse_text(step, answer_str: str) -> Tuple[bool, any, str]:
+        """Validate a text answer."""
+        is_valid, error = step.validation.validate(answer_str)
+        if not is_valid:
+            return False, None, error
+        return True, answer_str, None
+
+    @staticmethod
+    def _parse_ability(step, answer_str: str) -> Tuple[bool, any, str]:
+        """Parse and validate an ability score answer."""
+        try:
+            value = int(answer_str)
+        except ValueError:
+            return False, None, "Please enter a valid number"
+        is_valid, error = step.validation.validate(value)
+        if not is_valid:
+            return False, None, error
+        return True, value, None
+
+    @staticmethod
+    def _parse_choice(step, answer_str: str) -> Tuple[bool, any, str]:
+        """Validate a choice answer."""
+        if step.choices_set is not None and answer_str not in step.choices_set:
+            choices_str = ", ".join(step.choices)
+            return False, None, f"Must be one of: {choices_str}"
+        return True, answer_str, None
+
+    # Step type -> answer parser; each returns (is_valid, parsed_value, error)
+    _PARSERS = {
+        "text": _parse_text,
+        "ability": _parse_ability,
+        "choice": _parse_choice,
+    }
+
+    def _record_answer(self, step, value: any) -> None:
+        """Store the answer for the current step.
+
+        Args:
+            step: Template step being answered
+            value: Validated answer value
+        """
+        self.answers[step.id] = value
+        self._answers_by_pos[self.current_step_index] = value
 
     def _apply_step_answer(self, step, value: any) -> None:
         """Apply step answer to player object.
@@ -209,16 +271,7 @@ class TemplatePlayerCreationHandler:
         if step.type == "text" and step.field == "name":
             self.player.name = value
         elif step.type == "ability":
-            # Map ability shorthand (str -> strength)
-            ability_map = {
-                "str": "strength",
-                "dex": "dexterity",
-                "con": "constitution",
-                "int": "intelligence",
-                "wis": "wisdom",
-                "cha": "charisma",
-            }
-            ability = ability_map.get(step.field, step.field)
+            ability = _ABILITY_MAP.get(step.field, step.field)
             self.player.set_ability(ability, value)
         else:
             # Generic field assignment
@@ -235,11 +288,7 @@ class TemplatePlayerCreationHandler:
         if not current_step:
             return self._get_completion_message()
 
-        msg = current_step.prompt
-        if current_step.help:
-            msg += f"\n({current_step.help})"
-
-        return msg
+        return current_step.display_prompt
 
     def _get_completion_message(self) -> str:
         """Get message when all steps are complete.
@@ -263,7 +312,7 @@ class TemplatePlayerCreationHandler:
         Returns:
             Response message
         """
-        self.answers[step.id] = True
+        self._record_answer(step, True)
         self.current_step_index += 1
         return self._advance_to_next_step()
 
@@ -276,7 +325,7 @@ class TemplatePlayerCreationHandler:
         Returns:
             Response message
         """
-        self.answers[step.id] = False
+        self._record_answer(step, False)
         self.current_step_index += 1
         return self._advance_to_next_step()
 
@@ -288,6 +337,9 @@ class TemplatePlayerCreationHandler:
         """
         if self.current_step_index > 0:
             self.current_step_index -= 1
+            # Forget answers from the step being revisited onwards
+            index = self.current_step_index
+            self._answers_by_pos[index:] = [_UNSET] * (self._step_count - index)
             return self._advance_to_next_step()
         return "Already at first step"
 
@@ -299,6 +351,8 @@ class TemplatePlayerCreationHandler:
         """
         self.player = None
         self.answers = {}
+        self._answers_by_pos = [_UNSET] * self._step_count
+        self.finished = True
         return "Player creation cancelled."
 
     def _handle_status(self) -> str:
@@ -313,10 +367,11 @@ class TemplatePlayerCreationHandler:
         lines = [f"Player: {self.player.name}"]
 
         # Show answered steps so far
-        for i in range(min(self.current_step_index + 1, self.template.step_count())):
-            step = self.template.get_step(i)
-            if step and step.id in self.answers:
-                lines.append(f"  {step.id}: {self.answers[step.id]}")
+        lines.extend(
+            f"  {step.id}: {value}"
+            for step, value in zip(self.template.steps, self._answers_by_pos)
+            if value is not _UNSET
+        )
 
         return "\n".join(lines)
 
@@ -326,19 +381,7 @@ class TemplatePlayerCreationHandler:
         Returns:
             Help message
         """
-        help_lines = [
-            "Template Player Creation Commands:",
-            "  <answer>        - Answer the current step",
-            "  @roll d20       - Roll dice (if enabled for this step)",
-            "  @roll-top 3 4d6 - Roll 4d6, keep top 3",
-            "  @sum 10+5       - Calculate sum",
-            "  status          - Show current player status",
-            "  show            - Show current step details",
-            "  back            - Go to previous step",
-            "  cancel          - Cancel without saving",
-            "  help            - Show this help message",
-        ]
-        return "\n".join(help_lines)
+        return _HELP_TEXT
 
     def _handle_show(self) -> str:
         """Show current step details.
@@ -351,7 +394,7 @@ class TemplatePlayerCreationHandler:
             return "No more steps"
 
         lines = [
-            f"Step {self.current_step_index + 1} of {self.template.step_count()}",
+            f"Step {self.current_step_index + 1} of {self._step_count}",
             f"ID: {current_step.id}",
             f"Type: {current_step.type}",
             f"Prompt: {current_step.prompt}",
@@ -382,9 +425,6 @@ class TemplatePlayerCreationHandler:
             return False, "Cannot save: no player created"
 
         try:
-            from lib.player_manager import PlayerManager
-            from pathlib import Path
-
             game_path = game_manager.get_game_path(game_name)
             player_manager = PlayerManager(game_path)
 
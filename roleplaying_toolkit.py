@@ -1,15 +1,63 @@
 """Main entry point for the Roleplaying Toolkit."""
 
+import sys
+from typing import Callable, Optional
+
 from lib.custom_commands import create_extended_command_handler
 
 
-def main():
-    """Run the main Roleplaying Toolkit application."""
-    print("Welcome to the Roleplaying Toolkit!")
-    print("Type 'help' for available commands or 'quit' to exit.")
-    print("Try commands like: roll d20, status, save, load")
+def _line_reader(stdin, stdout):
+    """Choose how the REPL reads a line of input.
+
+    Interactive terminals keep input() for line editing; piped input is read
+    straight from stdin, writing and flushing the prompt once per line.
+
+    Args:
+        stdin: Input stream
+        stdout: Output stream for prompts
+
+    Returns:
+        Callable taking a prompt and returning the line read; raises
+        EOFError at end of input
+    """
+    try:
+        interactive = stdin.isatty()
+    except (AttributeError, ValueError):
+        interactive = False
+    if interactive:
+        return input
+
+    def read_line(prompt):
+        stdout.write(prompt)
+        stdout.flush()
+        line = stdin.readline()
+        if not line:
+            raise EOFError
+        return line
+
+    return read_line
+
+
+def main(read_line: Optional[Callable[[str], str]] = None):
+    """Run the main Roleplaying Toolkit application.
+
+    Args:
+        read_line: Callable taking a prompt and returning the next line,
+            raising EOFError at end of input (default: chosen by _line_reader)
+    """
+    stdout = sys.stdout
+    write = stdout.write
+    if read_line is None:
+        read_line = _line_reader(sys.stdin, stdout)
+
+    write(
+        "Welcome to the Roleplaying Toolkit!\n"
+        "Type 'help' for available commands or 'quit' to exit.\n"
+        "Try commands like: roll d20, status, save, load\n"
+    )
 
     command_handler = create_extended_command_handler()
+    process_input = command_handler.process_input
     current_context = None  # Track the current context handler
     context_name = None  # Track the name of the current context
     context_mode = None  # Track the mode (player_creation, template_player_creation, etc)
@@ -24,7 +72,7 @@ def main():
             else:
                 prompt = "> "
 
-            user_input = input(prompt).strip()
+            user_input = read_line(prompt).strip()
 
             # If in a context, use the context handler; otherwise use main handler
             if current_context is not None:
@@ -38,13 +86,11 @@ def main():
                     success, message = current_context.save_player(
                         game_manager, current_game
                     )
+                    write(f"{context_name}: {message}\n")
                     if success:
-                        print(f"{context_name}: {message}")
                         current_context = None
                         context_name = None
                         context_mode = None
-                    else:
-                        print(f"{context_name}: {message}")
                     continue
 
                 # Use the context's handle method
@@ -53,31 +99,21 @@ def main():
                 # Prefix the response with context name
                 if result_message:
                     formatted_message = f"{context_name}: {result_message}"
-                    print(formatted_message)
-
-                # Check if context has been cleared (player saved/exited)
-                if (hasattr(current_context, 'context')
-                        and current_context.context.player is None):
-                    # Check if message indicates we should exit context
-                    if ("Exited player creation" in result_message
-                            or "Saved player" in result_message):
-                        current_context = None
-                        context_name = None
-                        context_mode = None
+                    write(f"{formatted_message}\n")
 
-                # Check for cancellation in template mode
-                if (context_mode == "template_player_creation" 
-                        and "cancelled" in result_message.lower()):
+                # Leave the context once it reports it is done
+                # (player saved, creation exited or cancelled)
+                if current_context.finished:
                     current_context = None
                     context_name = None
                     context_mode = None
             else:
                 # Process the command normally
-                result = command_handler.process_input(user_input)
+                result = process_input(user_input)
 
                 # Display result message if there is one
                 if result.get("message"):
-                    print(result["message"])
+                    write(f"{result['message']}\n")
 
                 # Check if result indicates we're entering a context
                 if result.get("context") is not None:
@@ -101,10 +137,10 @@ def main():
                     exit_flag = True
 
         except KeyboardInterrupt:
-            print("\nExiting...")
+            write("\nExiting...\n")
             exit_flag = True
         except EOFError:
-            print("\nExiting...")
+            write("\nExiting...\n")
             exit_flag = True
 
 
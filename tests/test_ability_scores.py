@@ -35,19 +35,28 @@ class TestAbilityScores:
         assert not is_valid_ability("invalid_ability")
         assert not is_valid_ability("")
 
-    def test_get_ability_short(self):
+    @pytest.mark.parametrize(
+        "full,short",
+        [
+            ("strength", "str"),
+            ("dexterity", "dex"),
+            ("constitution", "con"),
+            ("intelligence", "int"),
+            ("wisdom", "wis"),
+            ("charisma", "cha"),
+        ],
+    )
+    def test_get_ability_short(self, full, short):
         """Test getting short form of abilities."""
-        assert get_ability_short("strength") == "str"
-        assert get_ability_short("dexterity") == "dex"
-        assert get_ability_short("constitution") == "con"
-        assert get_ability_short("intelligence") == "int"
-        assert get_ability_short("wisdom") == "wis"
-        assert get_ability_short("charisma") == "cha"
+        assert get_ability_short(full) == short
 
-    def test_get_ability_display(self):
+    @pytest.mark.parametrize(
+        "ability,display",
+        [("strength", "Strength"), ("dexterity", "Dexterity")],
+    )
+    def test_get_ability_display(self, ability, display):
         """Test getting display name of abilities."""
-        assert get_ability_display("strength") == "Strength"
-        assert get_ability_display("dexterity") == "Dexterity"
+        assert get_ability_display(ability) == display
 
     def test_is_valid_score(self):
         """Test score validation."""
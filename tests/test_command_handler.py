@@ -1,250 +1,229 @@
 """Unit tests for the command handler."""
 
-import unittest
+import copy
+import pytest
 from lib.command_handler import CommandHandler, Command
 
+# Commands every handler registers on construction
+_BUILTIN_COMMANDS = frozenset(("help", "quit", "exit"))
 
-class TestCommand(unittest.TestCase):
+
+def _clone_handler(template):
+    """Shallow-copy a handler so each test gets its own command registry.
+
+    Built-in commands are methods bound to the template, so they are rebound
+    to the clone; everything else is shared.
+    """
+    handler = copy.copy(template)
+    handler._commands = {
+        name: (
+            func.__func__.__get__(handler)
+            if getattr(func, "__self__", None) is template
+            else func
+        )
+        for name, func in template._commands.items()
+    }
+    return handler
+
+
+@pytest.fixture(scope="module")
+def shared_handler():
+    """Build one handler for tests that never register commands."""
+    return CommandHandler()
+
+
+@pytest.fixture
+def handler(shared_handler):
+    """Give each test its own copy of the shared handler."""
+    return _clone_handler(shared_handler)
+
+
+class TestCommand:
     """Test cases for the Command class."""
 
     def test_command_creation(self):
         """Test Command object creation."""
         cmd = Command("test", ["arg1", "arg2"], "test arg1 arg2")
 
-        self.assertEqual(cmd.name, "test")
-        self.assertEqual(cmd.args, ["arg1", "arg2"])
-        self.assertEqual(cmd.raw_input, "test arg1 arg2")
+        assert cmd.name == "test"
+        assert cmd.args == ["arg1", "arg2"]
+        assert cmd.raw_input == "test arg1 arg2"
 
     def test_command_repr(self):
         """Test Command string representation."""
         cmd = Command("test", ["arg1"], "test arg1")
-        expected = "Command(name='test', args=['arg1'])"
 
-        self.assertEqual(repr(cmd), expected)
+        assert repr(cmd) == "Command(name='test', args=['arg1'])"
 
 
-class TestCommandHandler(unittest.TestCase):
+class TestCommandHandler:
     """Test cases for the CommandHandler class."""
 
-    def setUp(self):
-        """Set up test fixtures."""
-        self.handler = CommandHandler()
-
-    def test_initialization(self):
+    def test_initialization(self, shared_handler):
         """Test CommandHandler initialization."""
         # Check that built-in commands are registered
-        available_commands = self.handler.get_available_commands()
-        self.assertIn("help", available_commands)
-        self.assertIn("quit", available_commands)
-        self.assertIn("exit", available_commands)
+        missing = _BUILTIN_COMMANDS - set(shared_handler.get_available_commands())
+        assert missing == set()
 
-    def test_register_command(self):
+    def test_register_command(self, handler):
         """Test command registration."""
 
         def test_handler(command):
             return {"success": True, "message": "test", "exit": False}
 
-        self.handler.register_command("test", test_handler)
-        available_commands = self.handler.get_available_commands()
-
-        self.assertIn("test", available_commands)
-
-    def test_parse_command_simple(self):
-        """Test parsing simple commands."""
-        cmd = self.handler.parse_command("help")
-
-        self.assertIsNotNone(cmd)
-        self.assertEqual(cmd.name, "help")
-        self.assertEqual(cmd.args, [])
-        self.assertEqual(cmd.raw_input, "help")
-
-    def test_parse_command_with_args(self):
-        """Test parsing commands with arguments."""
-        cmd = self.handler.parse_command("test arg1 arg2")
-
-        self.assertIsNotNone(cmd)
-        self.assertEqual(cmd.name, "test")
-        self.assertEqual(cmd.args, ["arg1", "arg2"])
-        self.assertEqual(cmd.raw_input, "test arg1 arg2")
-
-    def test_parse_command_with_quotes(self):
-        """Test parsing commands with quoted arguments."""
-        cmd = self.handler.parse_command('test "quoted arg" single')
-
-        self.assertIsNotNone(cmd)
-        self.assertEqual(cmd.name, "test")
-        self.assertEqual(cmd.args, ["quoted arg", "single"])
-
-    def test_parse_command_empty_input(self):
+        handler.register_command("test", test_handler)
+
+        assert "test" in handler.get_available_commands()
+
+    @pytest.mark.parametrize(
+        "raw, name, args",
+        [
+            ("help", "help", []),
+            ("HELP", "help", []),
+            ("test arg1 arg2", "test", ["arg1", "arg2"]),
+            ('test "quoted arg" single', "test", ["quoted arg", "single"]),
+            ("test 'quoted arg' two\\ words", "test", ["quoted arg", "two words"]),
+            # Should fall back to simple split when shlex fails
+            ('test "unclosed quote', "test", ['"unclosed', "quote"]),
+        ],
+    )
+    def test_parse_command(self, shared_handler, raw, name, args):
+        """Test parsing commands into a name and arguments."""
+        cmd = shared_handler.parse_command(raw)
+
+        assert cmd is not None
+        assert cmd.name == name
+        assert cmd.args == args
+        assert cmd.raw_input == raw
+
+    @pytest.mark.parametrize("raw", ["", "   "])
+    def test_parse_command_empty_input(self, shared_handler, raw):
         """Test parsing empty input."""
-        cmd = self.handler.parse_command("")
-        self.assertIsNone(cmd)
-
-        cmd = self.handler.parse_command("   ")
-        self.assertIsNone(cmd)
-
-    def test_parse_command_unclosed_quotes(self):
-        """Test parsing commands with unclosed quotes."""
-        cmd = self.handler.parse_command('test "unclosed quote')
+        assert shared_handler.parse_command(raw) is None
 
-        self.assertIsNotNone(cmd)
-        self.assertEqual(cmd.name, "test")
-        # Should fall back to simple split when shlex fails
-        self.assertEqual(cmd.args, ['"unclosed', "quote"])
-
-    def test_parse_command_case_insensitive(self):
-        """Test that command names are case insensitive."""
-        cmd = self.handler.parse_command("HELP")
-
-        self.assertIsNotNone(cmd)
-        self.assertEqual(cmd.name, "help")
-
-    def test_execute_builtin_help_command(self):
+    def test_execute_builtin_help_command(self, shared_handler):
         """Test executing the built-in help command."""
-        cmd = Command("help", [], "help")
-        result = self.handler.execute_command(cmd)
-
-        self.assertTrue(result["success"])
-        self.assertIn("Available commands:", result["message"])
-        self.assertFalse(result["exit"])
+        result = shared_handler.execute_command(Command("help", [], "help"))
 
-    def test_execute_builtin_quit_command(self):
-        """Test executing the built-in quit command."""
-        cmd = Command("quit", [], "quit")
-        result = self.handler.execute_command(cmd)
+        assert result["success"] is True
+        assert "Available commands:" in result["message"]
+        assert result["exit"] is False
 
-        self.assertTrue(result["success"])
-        self.assertEqual(result["message"], "Goodbye!")
-        self.assertTrue(result["exit"])
+    @pytest.mark.parametrize("name", ["quit", "exit"])
+    def test_execute_builtin_exit_commands(self, shared_handler, name):
+        """Test executing the built-in quit and exit commands."""
+        result = shared_handler.execute_command(Command(name, [], name))
 
-    def test_execute_builtin_exit_command(self):
-        """Test executing the built-in exit command."""
-        cmd = Command("exit", [], "exit")
-        result = self.handler.execute_command(cmd)
+        assert result == {"success": True, "message": "Goodbye!", "exit": True}
 
-        self.assertTrue(result["success"])
-        self.assertEqual(result["message"], "Goodbye!")
-        self.assertTrue(result["exit"])
-
-    def test_execute_unknown_command(self):
+    def test_execute_unknown_command(self, shared_handler):
         """Test executing an unknown command."""
-        cmd = Command("unknown", [], "unknown")
-        result = self.handler.execute_command(cmd)
+        result = shared_handler.execute_command(Command("unknown", [], "unknown"))
 
-        self.assertFalse(result["success"])
-        self.assertIn("Unknown command: unknown", result["message"])
-        self.assertFalse(result["exit"])
+        assert result["success"] is False
+        assert "Unknown command: unknown" in result["message"]
+        assert result["exit"] is False
 
-    def test_execute_custom_command(self):
+    def test_execute_custom_command(self, handler):
         """Test executing a custom registered command."""
 
         def custom_handler(command):
             return {"success": True, "message": f"Custom command executed with args: {command.args}", "exit": False}
 
-        self.handler.register_command("custom", custom_handler)
-        cmd = Command("custom", ["arg1", "arg2"], "custom arg1 arg2")
-        result = self.handler.execute_command(cmd)
+        handler.register_command("custom", custom_handler)
+        result = handler.execute_command(Command("custom", ["arg1", "arg2"], "custom arg1 arg2"))
 
-        self.assertTrue(result["success"])
-        self.assertIn("Custom command executed with args: ['arg1', 'arg2']", result["message"])
-        self.assertFalse(result["exit"])
+        assert result["success"] is True
+        assert "Custom command executed with args: ['arg1', 'arg2']" in result["message"]
+        assert result["exit"] is False
 
-    def test_execute_command_with_exception(self):
+    def test_execute_command_with_exception(self, handler):
         """Test executing a command that raises an exception."""
 
         def failing_handler(command):
             raise ValueError("Test error")
 
-        self.handler.register_command("fail", failing_handler)
-        cmd = Command("fail", [], "fail")
-        result = self.handler.execute_command(cmd)
+        handler.register_command("fail", failing_handler)
+        result = handler.execute_command(Command("fail", [], "fail"))
 
-        self.assertFalse(result["success"])
-        self.assertIn("Error executing command 'fail': Test error", result["message"])
-        self.assertFalse(result["exit"])
+        assert result["success"] is False
+        assert "Error executing command 'fail': Test error" in result["message"]
+        assert result["exit"] is False
 
-    def test_process_input_valid_command(self):
+    def test_process_input_valid_command(self, shared_handler):
         """Test processing valid input."""
-        result = self.handler.process_input("help")
+        result = shared_handler.process_input("help")
 
-        self.assertTrue(result["success"])
-        self.assertIn("Available commands:", result["message"])
-        self.assertFalse(result["exit"])
+        assert result["success"] is True
+        assert "Available commands:" in result["message"]
+        assert result["exit"] is False
 
-    def test_process_input_empty(self):
+    def test_process_input_empty(self, shared_handler):
         """Test processing empty input."""
-        result = self.handler.process_input("")
+        result = shared_handler.process_input("")
 
-        self.assertTrue(result["success"])
-        self.assertEqual(result["message"], "")
-        self.assertFalse(result["exit"])
+        assert result == {"success": True, "message": "", "exit": False}
 
-    def test_process_input_unknown_command(self):
+    def test_process_input_unknown_command(self, shared_handler):
         """Test processing unknown command."""
-        result = self.handler.process_input("unknown")
+        result = shared_handler.process_input("unknown")
 
-        self.assertFalse(result["success"])
-        self.assertIn("Unknown command: unknown", result["message"])
-        self.assertFalse(result["exit"])
+        assert result["success"] is False
+        assert "Unknown command: unknown" in result["message"]
+        assert result["exit"] is False
 
-    def test_get_available_commands(self):
+    def test_get_available_commands(self, shared_handler):
         """Test getting available commands."""
-        commands = self.handler.get_available_commands()
+        commands = shared_handler.get_available_commands()
 
-        self.assertIsInstance(commands, list)
-        self.assertIn("help", commands)
-        self.assertIn("quit", commands)
-        self.assertIn("exit", commands)
+        assert isinstance(commands, list)
+        assert _BUILTIN_COMMANDS - set(commands) == set()
         # Should be sorted
-        self.assertEqual(commands, sorted(commands))
+        assert commands == sorted(commands)
 
+    def test_clone_is_isolated(self, shared_handler, handler):
+        """Test that registering on a clone leaves the original untouched."""
+        handler.register_command("clone_only", lambda cmd: None)
+        assert "clone_only" not in shared_handler.get_available_commands()
 
-class TestCommandLoopIntegration(unittest.TestCase):
-    """Integration tests for command loop functionality."""
+        result = handler.process_input("help")
+        assert "clone_only" in result["message"]
 
-    def setUp(self):
-        """Set up test fixtures."""
-        self.handler = CommandHandler()
 
-    def test_complete_command_flow(self):
+class TestCommandLoopIntegration:
+    """Integration tests for command loop functionality."""
+
+    def test_complete_command_flow(self, shared_handler):
         """Test complete command processing flow."""
         # Test help command
-        result = self.handler.process_input("help")
-        self.assertTrue(result["success"])
-        self.assertFalse(result["exit"])
+        result = shared_handler.process_input("help")
+        assert result["success"] is True
+        assert result["exit"] is False
 
         # Test quit command
-        result = self.handler.process_input("quit")
-        self.assertTrue(result["success"])
-        self.assertTrue(result["exit"])
+        result = shared_handler.process_input("quit")
+        assert result["success"] is True
+        assert result["exit"] is True
 
-    def test_command_case_insensitivity(self):
+    def test_command_case_insensitivity(self, shared_handler):
         """Test that commands work regardless of case."""
-        results = [
-            self.handler.process_input("HELP"),
-            self.handler.process_input("Help"),
-            self.handler.process_input("hElP"),
-            self.handler.process_input("help"),
-        ]
-
-        for result in results:
-            self.assertTrue(result["success"])
-            self.assertIn("Available commands:", result["message"])
-
-    def test_whitespace_handling(self):
+        for variant in ("HELP", "Help", "hElP", "help"):
+            result = shared_handler.process_input(variant)
+            success, message = result["success"], result["message"]
+
+            assert success is True, variant
+            assert "Available commands:" in message, variant
+
+    def test_whitespace_handling(self, handler):
         """Test handling of various whitespace scenarios."""
         # Leading/trailing whitespace
-        result = self.handler.process_input("  help  ")
-        self.assertTrue(result["success"])
+        result = handler.process_input("  help  ")
+        assert result["success"] is True
 
         # Multiple spaces between command and args
-        self.handler.register_command(
+        handler.register_command(
             "test", lambda cmd: {"success": True, "message": f"args: {cmd.args}", "exit": False}
         )
-        result = self.handler.process_input("test   arg1    arg2")
-        self.assertTrue(result["success"])
-        self.assertIn("['arg1', 'arg2']", result["message"])
-
-
-if __name__ == "__main__":
-    unittest.main()
+        result = handler.process_input("test   arg1    arg2")
+        assert result["success"] is True
+        assert "['arg1', 'arg2']" in result["message"]
@@ -5,6 +5,7 @@ from unittest.mock import patch, MagicMock
 import sys
 import io
 import os
+import tempfile
 from contextlib import redirect_stdout
 
 # Add the project root to the path so we can import roleplaying_toolkit
@@ -31,7 +32,7 @@ class TestMainCommandLoop(unittest.TestCase):
         captured_output = io.StringIO()
 
         with redirect_stdout(captured_output):
-            roleplaying_toolkit.main()
+            roleplaying_toolkit.main(read_line=mock_input)
 
         output = captured_output.getvalue()
 
@@ -62,7 +63,7 @@ class TestMainCommandLoop(unittest.TestCase):
         captured_output = io.StringIO()
 
         with redirect_stdout(captured_output):
-            roleplaying_toolkit.main()
+            roleplaying_toolkit.main(read_line=mock_input)
 
         output = captured_output.getvalue()
 
@@ -87,7 +88,7 @@ class TestMainCommandLoop(unittest.TestCase):
         captured_output = io.StringIO()
 
         with redirect_stdout(captured_output):
-            roleplaying_toolkit.main()
+            roleplaying_toolkit.main(read_line=mock_input)
 
         output = captured_output.getvalue()
 
@@ -115,7 +116,7 @@ class TestMainCommandLoop(unittest.TestCase):
         captured_output = io.StringIO()
 
         with redirect_stdout(captured_output):
-            roleplaying_toolkit.main()
+            roleplaying_toolkit.main(read_line=mock_input)
 
         output = captured_output.getvalue()
 
@@ -137,7 +138,7 @@ class TestMainCommandLoop(unittest.TestCase):
         captured_output = io.StringIO()
 
         with redirect_stdout(captured_output):
-            roleplaying_toolkit.main()
+            roleplaying_toolkit.main(read_line=mock_input)
 
         output = captured_output.getvalue()
 
@@ -159,7 +160,7 @@ class TestMainCommandLoop(unittest.TestCase):
         captured_output = io.StringIO()
 
         with redirect_stdout(captured_output):
-            roleplaying_toolkit.main()
+            roleplaying_toolkit.main(read_line=mock_input)
 
         output = captured_output.getvalue()
 
@@ -172,6 +173,25 @@ class TestMainCommandLoop(unittest.TestCase):
         # Verify input was called 4 times
         self.assertEqual(mock_input.call_count, 4)
 
+    def test_main_reads_piped_stdin(self):
+        """Test main reads piped input from stdin when no reader is given."""
+        captured_output = io.StringIO()
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            cwd = os.getcwd()
+            os.chdir(tmpdir)
+            try:
+                with patch("sys.stdin", io.StringIO("help\nquit\n")):
+                    with redirect_stdout(captured_output):
+                        roleplaying_toolkit.main()
+            finally:
+                os.chdir(cwd)
+
+        output = captured_output.getvalue()
+
+        self.assertIn("Available commands:", output)
+        self.assertTrue(output.endswith("> Goodbye!\n"))
+
 
 if __name__ == "__main__":
     unittest.main()
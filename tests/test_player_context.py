@@ -3,7 +3,7 @@
 import pytest
 import tempfile
 from pathlib import Path
-from lib.player_context import PlayerCreationContext, PlayerCreationHandler
+from lib.player_context import PlayerCreationContext, PlayerCreationHandler, _roll_4d6_drop_lowest
 from lib.game_manager import GameManager
 
 
@@ -85,6 +85,14 @@ class TestPlayerCreationContext:
             score = context.player.get_ability(ability)
             assert score is None  # Should still be unset
 
+    def test_roll_4d6_drop_lowest_batch(self):
+        """Test rolling several sets of ability scores at once."""
+        rows = _roll_4d6_drop_lowest(50)
+        assert len(rows) == 50
+        for row in rows:
+            assert len(row) == 6
+            assert all(3 <= score <= 18 for score in row)
+
     def test_roll_abilities_no_player(self, game_manager):
         """Test rolling abilities when no player exists."""
         context = PlayerCreationContext(game_manager, "test_game")
@@ -185,8 +193,18 @@ class TestPlayerCreationHandler:
         handler = PlayerCreationHandler(game_manager, "test_game")
         handler.handle("name Jackbar")
         handler.handle("set strength 14")
+        assert handler.finished is False
         response = handler.handle("save")
         assert "Saved" in response
+        assert handler.finished is True
+
+    def test_handle_exit_command(self, game_manager):
+        """Test that exit marks the handler as finished."""
+        handler = PlayerCreationHandler(game_manager, "test_game")
+        handler.handle("name Jackbar")
+        response = handler.handle("exit")
+        assert "Exited" in response
+        assert handler.finished is True
 
     def test_handle_invalid_command(self, game_manager):
         """Test handling invalid command."""
@@ -83,6 +83,17 @@ class TestPlayerManager:
         player_names = {p.name for p in all_players}
         assert player_names == {"Jackbar", "Elara", "Thorin"}
 
+    def test_list_player_names(self, temp_game_dir):
+        """Test listing player names without loading players."""
+        pm = PlayerManager(temp_game_dir)
+        assert pm.list_player_names() == []
+
+        pm.create_player("Thorin")
+        pm.create_player("Elara")
+        (pm.players_directory / "notes.txt").write_text("not a player")
+
+        assert pm.list_player_names() == ["Elara", "Thorin"]
+
     def test_delete_player(self, temp_game_dir):
         """Test deleting a player."""
         pm = PlayerManager(temp_game_dir)
@@ -3,9 +3,12 @@
 import pytest
 import tempfile
 import shutil
+import threading
+import time
 from pathlib import Path
+from unittest.mock import patch
 
-from lib.state_manager import StateManager
+from lib.state_manager import StateManager, QueuedStateManager
 from lib.journey_system import JourneyManager
 
 
@@ -55,6 +58,17 @@ class TestStateManager:
         assert "journey_manager" in data
         assert len(data["journey_manager"]["journeys"]) == 2
 
+    def test_save_leaves_no_temp_file(self):
+        """Test that saving replaces the target without leaving a temp file."""
+        journey_manager = JourneyManager()
+        self.state_manager.save_state(journey_manager, "atomic")
+        journey_manager.start_journey("Test Journey", 5, 2)
+        self.state_manager.save_state(journey_manager, "atomic")
+
+        assert sorted(p.name for p in Path(self.temp_dir).iterdir()) == ["atomic.yaml"]
+        loaded = self.state_manager.load_state("atomic")
+        assert loaded.journey_count == 1
+
     def test_save_default_name(self):
         """Test saving with default name."""
         journey_manager = JourneyManager()
@@ -285,3 +299,127 @@ class TestStateManager:
             assert orig.difficulty == loaded.difficulty
             assert orig.progress == loaded.progress
             assert orig.is_completed() == loaded.is_completed()
+
+
+class TestQueuedStateManager:
+    """Test cases for QueuedStateManager class."""
+
+    def setup_method(self):
+        """Set up test environment."""
+        self.temp_dir = tempfile.mkdtemp()
+        self.state_manager = StateManager(self.temp_dir)
+
+    def teardown_method(self):
+        """Clean up test environment."""
+        shutil.rmtree(self.temp_dir)
+
+    def test_burst_of_saves_is_coalesced(self):
+        """Test that rapid saves under one name produce a single write."""
+        journey_manager = JourneyManager()
+        queued = QueuedStateManager(self.state_manager, flush_interval_ms=60_000)
+        try:
+            for steps in range(1, 6):
+                journey_manager.start_journey(f"Journey {steps}", steps, 1)
+                result = queued.save_state(journey_manager)
+                assert "quicksave" in result
+
+            assert self.state_manager.list_saves() == []
+            assert queued.flush() == 1
+            assert queued.flush() == 0
+        finally:
+            queued.close()
+
+        loaded = self.state_manager.load_state("quicksave")
+        assert loaded.journey_count == 5
+
+    def test_close_drains_pending_saves(self):
+        """Test that closing writes every pending save."""
+        journey_manager = JourneyManager()
+        with QueuedStateManager(self.state_manager, flush_interval_ms=60_000) as queued:
+            queued.save_state(journey_manager, "slot1")
+            queued.save_state(journey_manager, "slot2")
+
+        assert self.state_manager.list_saves() == ["slot1", "slot2"]
+        with pytest.raises(RuntimeError, match="closed"):
+            queued.save_state(journey_manager, "slot3")
+
+    def test_invalid_name_rejected_immediately(self):
+        """Test that invalid save names fail at queue time."""
+        with QueuedStateManager(self.state_manager) as queued:
+            with pytest.raises(ValueError, match="Save name cannot be empty"):
+                queued.save_state(JourneyManager(), "")
+
+    def test_failed_flush_requeues_on_any_error(self):
+        """Test that saves are kept when a write fails with any exception."""
+        with QueuedStateManager(self.state_manager, flush_interval_ms=60_000) as queued:
+            queued.save_state(JourneyManager(), "slot1")
+            with patch.object(
+                self.state_manager, "write_state", side_effect=RuntimeError("boom")
+            ):
+                with pytest.raises(RuntimeError, match="boom"):
+                    queued.flush()
+            assert queued.flush() == 1
+
+        assert self.state_manager.list_saves() == ["slot1"]
+
+    def test_background_failure_is_reported_once(self, capsys):
+        """Test that a failing background flush warns once and keeps the saves."""
+        queued = QueuedStateManager(self.state_manager, flush_interval_ms=5)
+        try:
+            with patch.object(
+                self.state_manager, "write_state", side_effect=OSError("disk full")
+            ) as mock_write:
+                queued.save_state(JourneyManager(), "slot1")
+                deadline = time.monotonic() + 2
+                while mock_write.call_count < 3 and time.monotonic() < deadline:
+                    time.sleep(0.005)
+        finally:
+            queued.close()
+
+        assert mock_write.call_count >= 3
+        assert capsys.readouterr().out == (
+            "Warning: Failed to write queued saves: disk full\n"
+        )
+        assert self.state_manager.list_saves() == ["slot1"]
+
+    def test_flushes_do_not_overlap(self):
+        """Test that concurrent flushes write one at a time, oldest first."""
+        journey_manager = JourneyManager()
+        write_state = self.state_manager.write_state
+        active = []
+        max_active = []
+        writing = threading.Event()
+
+        def slow_write(safe_name, state):
+            active.append(safe_name)
+            max_active.append(len(active))
+            writing.set()
+            time.sleep(0.05)
+            try:
+                return write_state(safe_name, state)
+            finally:
+                active.pop()
+
+        with patch.object(self.state_manager, "write_state", side_effect=slow_write):
+            with QueuedStateManager(self.state_manager, flush_interval_ms=60_000) as queued:
+                queued.save_state(journey_manager)
+                background = threading.Thread(target=queued.flush)
+                background.start()
+                writing.wait()
+
+                journey_manager.start_journey("Newer", 3, 1)
+                queued.save_state(journey_manager)
+                assert queued.flush() == 1
+                background.join()
+
+        assert max(max_active) == 1
+        assert self.state_manager.load_state("quicksave").journey_count == 1
+
+    def test_close_registered_at_exit(self):
+        """Test that pending saves are drained at interpreter exit."""
+        with patch("lib.state_manager.atexit") as mock_atexit:
+            queued = QueuedStateManager(self.state_manager, flush_interval_ms=60_000)
+            mock_atexit.register.assert_called_once_with(queued.close)
+
+            queued.close()
+            mock_atexit.unregister.assert_called_once_with(queued.close)
@@ -1,8 +1,12 @@
 """Tests for template system."""
 
+import dataclasses
+import pickle
 import pytest
+import sys
 import tempfile
 from pathlib import Path
+from unittest.mock import patch
 
 import yaml
 
@@ -63,6 +67,40 @@ class TestValidationRules:
         assert valid is False
         assert "one of" in msg
 
+    def test_combined_rules(self):
+        """Test that each configured rule reports its own message."""
+        rules = ValidationRules(min_length=2, max_length=4, min=1, max=20)
+        assert rules.validate("a") == (False, "Minimum length is 2")
+        assert rules.validate("abcde") == (False, "Maximum length is 4")
+        assert rules.validate("abc") == (True, None)
+        assert rules.validate(0) == (False, "Minimum value is 1")
+        assert rules.validate(21) == (False, "Maximum value is 20")
+        assert rules.validate(None) == (True, None)
+
+    def test_length_checked_before_choices(self):
+        """Test that length rules are reported before the choices rule."""
+        rules = ValidationRules(min_length=2, choices=["ab", "c"])
+        assert rules.validate("c") == (False, "Minimum length is 2")
+        assert rules.validate("zz") == (False, "Must be one of: ab, c")
+        assert rules.validate("ab") == (True, None)
+        assert rules.validate(1) == (True, None)
+
+    def test_rules_survive_pickling(self):
+        """Test that the compiled validator is rebuilt after unpickling."""
+        rules = pickle.loads(pickle.dumps(ValidationRules(max=5)))
+        assert rules == ValidationRules(max=5)
+        assert rules.validate(6) == (False, "Maximum value is 5")
+
+    def test_rules_are_frozen(self):
+        """Test that rules cannot drift from their compiled validator."""
+        rules = ValidationRules()
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            rules.max = 5
+
+        changed = dataclasses.replace(rules, max=5)
+        assert changed.validate(6) == (False, "Maximum value is 5")
+        assert rules.validate(6) == (True, None)
+
 
 class TestTemplateStep:
     """Test template step model."""
@@ -97,6 +135,47 @@ class TestTemplateStep:
         assert step.validation.min == 3
         assert step.validation.max == 20
 
+    def test_step_from_dict_defaults(self):
+        """Test defaults for a step missing its type and validation rules."""
+        step = TemplateStep.from_dict({"id": "name", "prompt": "Name?", "validation": None})
+        assert step.type == "text"
+        assert step.validation == ValidationRules()
+
+    def test_step_choices_set(self):
+        """Test that choices are also kept as a set for lookups."""
+        step = TemplateStep.from_dict(
+            {"id": "class", "prompt": "Class?", "type": "choice", "choices": ["a", "b"]}
+        )
+        assert step.choices == ["a", "b"]
+        assert step.choices_set == frozenset({"a", "b"})
+        assert "choices_set" not in step.to_dict()
+        assert TemplateStep(id="name", prompt="Name?", type="text").choices_set is None
+
+    def test_step_display_prompt(self):
+        """Test that the display prompt includes help text when present."""
+        step = TemplateStep(id="str", prompt="Strength?", type="ability", help="1-20")
+        assert step.display_prompt == "Strength?\n(1-20)"
+        assert TemplateStep(id="name", prompt="Name?", type="text").display_prompt == "Name?"
+
+    def test_step_replace_recomputes_derived_values(self):
+        """Test that replacing step fields rebuilds the precomputed values."""
+        step = TemplateStep(id="class", prompt="Class?", type="choice", choices=["a"])
+        changed = dataclasses.replace(
+            step, choices=["b", "c"], prompt="Pick a class", help="b or c"
+        )
+
+        assert changed.choices_set == frozenset({"b", "c"})
+        assert changed.display_prompt == "Pick a class\n(b or c)"
+        assert step.choices_set == frozenset({"a"})
+        assert step.display_prompt == "Class?"
+
+    def test_step_from_dict_interns_id_and_type(self):
+        """Test that step IDs and types are interned strings."""
+        step_id = "".join(["stren", "gth"])
+        step = TemplateStep.from_dict({"id": step_id, "prompt": "Str?", "type": "ability"})
+        assert step.id is sys.intern("strength")
+        assert step.type is sys.intern("ability")
+
     def test_step_to_dict(self):
         """Test converting step to dictionary."""
         step = TemplateStep(
@@ -112,6 +191,21 @@ class TestTemplateStep:
         assert data["type"] == "text"
         assert data["field"] == "name"
 
+    def test_step_to_dict_copies_validation(self):
+        """Test that serialized validation rules don't alias the step."""
+        step = TemplateStep(
+            id="color",
+            prompt="Favorite color?",
+            type="text",
+            validation=ValidationRules(choices=["red", "blue"]),
+        )
+        data = step.to_dict()
+        assert data["validation"]["choices"] == ["red", "blue"]
+        assert data["validation"]["parse_rolls"] is False
+
+        data["validation"]["choices"].append("green")
+        assert step.validation.choices == ["red", "blue"]
+
 
 class TestTemplate:
     """Test template model."""
@@ -194,6 +288,16 @@ class TestTemplate:
         with pytest.raises(ValueError, match="unique IDs"):
             Template.from_dict(data)
 
+    def test_template_models_use_slots(self):
+        """Test that template models carry no per-instance __dict__."""
+        step = TemplateStep(id="name", prompt="Name?", type="text")
+        template = Template(name="Test", version="1.0", description="", steps=[step])
+
+        for obj in (step.validation, step, template):
+            assert not hasattr(obj, "__dict__")
+        with pytest.raises(AttributeError):
+            step.unknown = True
+
     def test_template_validate(self):
         """Test template validation."""
         data = {
@@ -253,6 +357,23 @@ class TestTemplate:
         assert template.get_step_by_id("dexterity") == step2
         assert template.get_step_by_id("unknown") is None
 
+    def test_step_index_follows_steps(self):
+        """Test that get_step_by_id cannot go stale when steps change."""
+        step1 = TemplateStep(id="strength", prompt="Strength?", type="ability")
+        step2 = TemplateStep(id="dexterity", prompt="Dexterity?", type="ability")
+        template = Template(name="Test", version="1.0", description="", steps=[step1])
+
+        assert template.steps == (step1,)
+        with pytest.raises(AttributeError):
+            template.steps.append(step2)
+
+        template.steps = [step1, step2]
+        assert template.get_step_by_id("dexterity") is step2
+
+        changed = dataclasses.replace(template, steps=[step2])
+        assert changed.get_step_by_id("strength") is None
+        assert changed.get_step_by_id("dexterity") is step2
+
     def test_step_count(self):
         """Test step count."""
         template = Template(
@@ -358,6 +479,31 @@ class TestTemplateLoader:
         templates = loader.list_templates()
         assert templates == ["apple", "banana", "zebra"]
 
+    def test_loader_loads_lazily(self, temp_templates_dir):
+        """Test that templates are only parsed when first requested."""
+        for name in ["first", "second"]:
+            template_data = {
+                "name": name,
+                "version": "1.0",
+                "steps": [{"id": "test", "prompt": "Test?", "type": "text"}],
+            }
+            with open(temp_templates_dir / f"{name}.yaml", "w") as f:
+                yaml.dump(template_data, f)
+
+        loader = TemplateLoader(str(temp_templates_dir))
+        assert loader.list_templates() == ["first", "second"]
+        assert loader.templates == {}
+
+        assert loader.load_template("second").name == "second"
+        assert list(loader.templates) == ["second"]
+        assert loader.load_template("second") is loader.load_template("second")
+
+    def test_loader_rejects_path_names(self, temp_templates_dir):
+        """Test that template names cannot escape the templates directory."""
+        loader = TemplateLoader(str(temp_templates_dir))
+        assert loader.load_template("../player") is None
+        assert loader.load_template("") is None
+
     def test_loader_template_not_found(self, temp_templates_dir):
         """Test loading non-existent template."""
         loader = TemplateLoader(str(temp_templates_dir))
@@ -389,6 +535,21 @@ class TestTemplateLoader:
         assert info["description"] == "A test template"
         assert info["steps"] == "2"
 
+    def test_loader_template_info_invalid_template(self, temp_templates_dir):
+        """Test that info is not reported for a template that fails validation."""
+        with open(temp_templates_dir / "bad.yaml", "w") as f:
+            f.write(
+                'name: Bad\nversion: "1"\nsteps:\n'
+                "  - {id: a, prompt: A?, type: text}\n"
+                "  - {id: a, prompt: B?, type: bogus}\n"
+            )
+        with open(temp_templates_dir / "empty_steps.yaml", "w") as f:
+            f.write('name: Empty\nversion: "1"\nsteps:\n')
+
+        loader = TemplateLoader(str(temp_templates_dir))
+        assert loader.get_template_info("bad") is None
+        assert loader.get_template_info("empty_steps") is None
+
     def test_loader_reload_templates(self, temp_templates_dir):
         """Test reloading templates."""
         loader = TemplateLoader(str(temp_templates_dir))
@@ -410,6 +571,132 @@ class TestTemplateLoader:
         assert loader.template_count() == 1
         assert "1 templates" in message
 
+    def test_loader_reload_many_templates(self, temp_templates_dir):
+        """Test reloading several templates skips only the invalid ones."""
+        for i in range(12):
+            template_data = {
+                "name": f"Template {i}",
+                "version": "1.0",
+                "steps": [{"id": "test", "prompt": "Test?", "type": "text"}],
+            }
+            with open(temp_templates_dir / f"t{i:02d}.yaml", "w") as f:
+                yaml.dump(template_data, f)
+        with open(temp_templates_dir / "broken.yaml", "w") as f:
+            f.write("name: Broken\n")
+
+        loader = TemplateLoader(str(temp_templates_dir))
+        success, message = loader.reload_templates()
+
+        assert success is True
+        assert "12 templates" in message
+        assert "broken" not in loader.templates
+        assert loader.templates["t07"].name == "Template 7"
+
+    def test_loader_remembers_invalid_templates(self, temp_templates_dir, capsys):
+        """Test that an invalid template is reported once and then unlisted."""
+        broken_file = temp_templates_dir / "broken.yaml"
+        broken_file.write_text("name: Broken\n")
+
+        loader = TemplateLoader(str(temp_templates_dir))
+        assert loader.list_templates() == ["broken"]
+
+        assert loader.load_template("broken") is None
+        assert capsys.readouterr().out.count("Failed to load template 'broken'") == 1
+        assert loader.load_template("broken") is None
+        assert capsys.readouterr().out == ""
+        assert loader.list_templates() == []
+        assert loader.template_count() == 0
+
+        # Fixing the file makes it loadable again
+        template_data = {
+            "name": "Fixed",
+            "version": "1.0",
+            "steps": [{"id": "test", "prompt": "Test?", "type": "text"}],
+        }
+        with open(broken_file, "w") as f:
+            yaml.dump(template_data, f)
+        assert loader.load_template("broken").name == "Fixed"
+        assert loader.list_templates() == ["broken"]
+
+    @pytest.fixture
+    def cache_dir(self, tmp_path):
+        """Create a separate cache directory."""
+        return tmp_path / "cache"
+
+    def test_loader_uses_cache_for_unchanged_files(self, temp_templates_dir, cache_dir):
+        """Test that unchanged templates are loaded from the parse cache."""
+        template_data = {
+            "name": "Cached Template",
+            "version": "1.0",
+            "steps": [{"id": "test", "prompt": "Test?", "type": "text"}],
+        }
+        template_file = temp_templates_dir / "cached.yaml"
+        with open(template_file, "w") as f:
+            yaml.dump(template_data, f)
+
+        TemplateLoader(str(temp_templates_dir), str(cache_dir)).load_template("cached")
+        assert [p.name[:7] for p in cache_dir.glob("*.pkl")] == ["cached-"]
+
+        with patch("lib.template_loader.yaml.load") as mock_load:
+            loader = TemplateLoader(str(temp_templates_dir), str(cache_dir))
+            assert loader.load_template("cached").name == "Cached Template"
+            mock_load.assert_not_called()
+
+    def test_loader_cache_invalidated_on_change(self, temp_templates_dir, cache_dir):
+        """Test that editing a template bypasses the stale cache entry."""
+        template_data = {
+            "name": "Original",
+            "version": "1.0",
+            "steps": [{"id": "test", "prompt": "Test?", "type": "text"}],
+        }
+        template_file = temp_templates_dir / "changing.yaml"
+        with open(template_file, "w") as f:
+            yaml.dump(template_data, f)
+        TemplateLoader(str(temp_templates_dir), str(cache_dir)).load_template("changing")
+
+        template_data["name"] = "Updated Name"
+        with open(template_file, "w") as f:
+            yaml.dump(template_data, f)
+
+        loader = TemplateLoader(str(temp_templates_dir), str(cache_dir))
+        assert loader.load_template("changing").name == "Updated Name"
+
+    def test_loader_ignores_unloadable_cache_entry(self, temp_templates_dir, cache_dir):
+        """Test that a cache entry naming a missing module falls back to YAML."""
+        template_data = {
+            "name": "Valid",
+            "version": "1.0",
+            "steps": [{"id": "test", "prompt": "Test?", "type": "text"}],
+        }
+        with open(temp_templates_dir / "valid.yaml", "w") as f:
+            yaml.dump(template_data, f)
+        loader = TemplateLoader(str(temp_templates_dir), str(cache_dir))
+        loader.load_template("valid")
+
+        # Keep the matching key but replace the template with a global
+        # reference to a module that does not exist
+        (cache_path,) = cache_dir.glob("*.pkl")
+        with open(cache_path, "rb") as f:
+            cache_key = pickle.load(f)
+        cache_path.write_bytes(pickle.dumps(cache_key) + b"cnosuchmod\nThing\n.")
+
+        loader = TemplateLoader(str(temp_templates_dir), str(cache_dir))
+        assert loader.load_template("valid").name == "Valid"
+
+    def test_loader_does_not_cache_by_default(self, temp_templates_dir):
+        """Test that nothing is written next to the templates without a cache dir."""
+        template_data = {
+            "name": "Uncached",
+            "version": "1.0",
+            "steps": [{"id": "test", "prompt": "Test?", "type": "text"}],
+        }
+        with open(temp_templates_dir / "uncached.yaml", "w") as f:
+            yaml.dump(template_data, f)
+
+        loader = TemplateLoader(str(temp_templates_dir))
+        assert loader.load_template("uncached").name == "Uncached"
+        assert [p.name for p in temp_templates_dir.iterdir()] == ["uncached.yaml"]
+
     def test_loader_validate_template_file(self, temp_templates_dir):
         """Test validating a template file."""
         template_data = {
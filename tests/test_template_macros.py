@@ -206,6 +206,30 @@ class TestRollExecution:
         )
         assert success is False
 
+    def test_roll_zero_sided_die(self):
+        """Test rolling a zero-sided die fails cleanly."""
+        success, value, message = MacroProcessor.execute(
+            "roll", {"num_dice": 1, "dice_size": 0, "modifier": 0}
+        )
+        assert success is False
+        assert "at least 1" in message
+
+    def test_roll_without_message(self):
+        """Test that emit_message=False returns the total with no message."""
+        params = {"num_dice": 4, "dice_size": 6, "modifier": 2}
+        success, value, message = MacroProcessor.execute("roll", params, emit_message=False)
+        assert success is True
+        assert 6 <= value <= 26
+        assert message == ""
+
+        params["keep"] = 3
+        success, value, message = MacroProcessor.execute(
+            "roll_top", params, emit_message=False
+        )
+        assert success is True
+        assert 5 <= value <= 20
+        assert message == ""
+
 
 class TestSumExecution:
     """Test @sum macro execution."""
@@ -240,6 +264,28 @@ class TestSumExecution:
         assert success is True
         assert value == 16
 
+    def test_sum_space_separated(self):
+        """Test summing space-separated values."""
+        success, value, message = MacroProcessor.execute(
+            "sum", {"values_str": "14 2 3"}
+        )
+        assert success is True
+        assert value == 19
+
+    def test_sum_trailing_operator(self):
+        """Test sum ending in an operator is rejected."""
+        success, value, message = MacroProcessor.execute(
+            "sum", {"values_str": "10 +"}
+        )
+        assert success is False
+
+    def test_sum_rejects_expressions(self):
+        """Test that non-arithmetic expressions are never evaluated."""
+        success, value, message = MacroProcessor.execute(
+            "sum", {"values_str": "__import__('os')"}
+        )
+        assert success is False
+
     def test_sum_invalid(self):
         """Test sum with invalid expression."""
         success, value, message = MacroProcessor.execute(
@@ -0,0 +1,130 @@
+"""Tests for template-based player creation handler."""
+
+import pytest
+
+from lib.template import Template
+from lib.template_player_context import TemplatePlayerCreationHandler
+
+
+@pytest.fixture
+def template():
+    """Create a small template covering each step type."""
+    return Template.from_dict(
+        {
+            "name": "Test Template",
+            "version": "1.0",
+            "description": "A test template",
+            "steps": [
+                {
+                    "id": "name",
+                    "prompt": "Name?",
+                    "type": "text",
+                    "field": "name",
+                    "validation": {"min_length": 1},
+                },
+                {
+                    "id": "strength",
+                    "prompt": "Strength?",
+                    "type": "ability",
+                    "field": "str",
+                    "macros_enabled": True,
+                    "validation": {"min": 1, "max": 20},
+                },
+                {"id": "confirm", "prompt": "Confirm?", "type": "confirmation"},
+            ],
+        }
+    )
+
+
+@pytest.fixture
+def handler(template):
+    """Create a handler for the test template."""
+    return TemplatePlayerCreationHandler(template, None)
+
+
+class TestTemplatePlayerCreationHandler:
+    """Test stepping through a template."""
+
+    def test_welcome_message(self, handler):
+        """Test the welcome message ends with the first prompt."""
+        assert handler.get_welcome_message() == (
+            "Starting player creation using template 'Test Template'.\n"
+            "Description: A test template\n"
+            "Total steps: 3\n"
+            "Type 'help' for available commands.\n"
+            "\n"
+            "Name?"
+        )
+
+    def test_commands_are_case_insensitive(self, handler):
+        """Test that built-in commands ignore case."""
+        assert "Template Player Creation Commands" in handler.handle("HELP")
+        assert handler.handle("Status") == "No player created yet"
+        assert handler.handle("back") == "Already at first step"
+        assert handler.handle("show").startswith("Step 1 of 3")
+
+    def test_full_walkthrough(self, handler):
+        """Test answering every step."""
+        assert handler.handle("Aria") == "Strength?"
+        assert handler.handle("25").startswith("Invalid input")
+        assert handler.handle("15") == "Confirm?"
+        assert handler.handle("maybe") == "Please answer 'yes' or 'no'"
+        assert "complete" in handler.handle("YES")
+
+        assert handler.player.name == "Aria"
+        assert handler.player.stats["strength"] == 15
+        assert handler.answers == {"name": "Aria", "strength": 15, "confirm": True}
+
+    def test_status_lists_answers(self, handler):
+        """Test that status shows answered steps."""
+        handler.handle("Aria")
+        handler.handle("12")
+        assert handler.handle("status") == "Player: Aria\n  name: Aria\n  strength: 12"
+
+    def test_status_after_back(self, handler):
+        """Test that going back drops the revisited answer from status."""
+        handler.handle("Aria")
+        handler.handle("12")
+        assert handler.handle("back") == "Strength?"
+        assert handler.handle("status") == "Player: Aria\n  name: Aria"
+
+        handler.handle("14")
+        assert handler.handle("status") == "Player: Aria\n  name: Aria\n  strength: 14"
+
+    def test_macro_answer(self, handler):
+        """Test answering an ability step with a macro."""
+        handler.handle("Aria")
+        response = handler.handle("@roll 1d6")
+        assert response.startswith("Rolled 1d6")
+        assert 1 <= handler.answers["strength"] <= 6
+
+    def test_choice_step(self):
+        """Test that choice steps only accept listed choices."""
+        template = Template.from_dict(
+            {
+                "name": "Choice",
+                "version": "1.0",
+                "description": "",
+                "steps": [
+                    {
+                        "id": "class",
+                        "prompt": "Class?",
+                        "type": "choice",
+                        "field": "character_class",
+                        "choices": ["fighter", "wizard"],
+                    }
+                ],
+            }
+        )
+        handler = TemplatePlayerCreationHandler(template, None)
+        assert handler.handle("bard") == "Invalid input: Must be one of: fighter, wizard"
+        assert "complete" in handler.handle("wizard")
+        assert handler.player.character_class == "wizard"
+
+    def test_cancel(self, handler):
+        """Test cancelling discards the player."""
+        handler.handle("Aria")
+        assert handler.handle("cancel") == "Player creation cancelled."
+        assert handler.player is None
+        assert handler.answers == {}
+        assert handler.finished is True